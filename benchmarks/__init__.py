@@ -0,0 +1,6 @@
+"""Benchmarks of the Judo REST API integration.
+
+Run from the repository root, e.g.:
+
+    python -m benchmarks.polling --entries 1,2,4,8 --output polling.json
+"""
@@ -0,0 +1,173 @@
+"""Codec microbenchmark.
+
+Measures the per item decoding of RestObject.decode for every format and the
+encoders format_int_message, format_str_message and order_hex_buffer on fixed
+corpora of raw hex payloads, seeded with the payloads of judo_rest_test.py.
+Reported per operation:
+
+- ns_per_op, best of the repeats
+- peak_bytes_per_op, the memory an operation allocates at its peak, traced
+  with tracemalloc (CPython does not count allocations)
+- retained_blocks, memory blocks still allocated after all operations, a
+  leak shows up here
+
+    python -m benchmarks.codec --iterations 100000 --output codec.json
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+# common puts the repository root on the path, import it first
+from .common import write_results
+
+from custom_components.judo_rest_api.jdconst import DEVICELISTS
+from custom_components.judo_rest_api.restobject import RestObject
+
+# translation key of the item decoding a corpus, format and raw responses
+DECODE_CORPORA = {
+    "water_total": ("NUMBER", ["ec221000", "47231000", "00000000", "ffffffff"]),
+    "salt_storage_mass": ("NUMBER", ["f6541100", "10270000", "0000"]),
+    "salt_storage_days": ("NUMBER", ["f6541100", "f6549800"]),
+    "device_number": ("NUMBER", ["64d90100"]),
+    "water_hardeness": ("NUMBER", ["0600", "1400"]),
+    "software_version": ("SW_VERSION", ["6b1502", "611402"]),
+    "install_date": ("TIMESTAMP", ["68c4921b", "5f5e1000"]),
+    "service_contact": (
+        "TEXT",
+        ["2b343920373139352036393235313720", "4a55444f20536572766963652020"],
+    ),
+    "device_type": ("STATUS", ["33", "3400", "4700"]),
+}
+
+# translation key of the item, function and its arguments
+ENCODE_CORPORA = {
+    "format_int_message": (
+        "salt_storage_mass",
+        "format_int_message",
+        [(21750, True), (10000, True), (0, True)],
+    ),
+    "format_int_message_1_byte": (
+        "water_hardeness",
+        "format_int_message",
+        [(6, True), (20, True)],
+    ),
+    "format_str_message": (
+        "service_contact",
+        "format_str_message",
+        [("+49 7195 692517 ", True), ("JUDO Service", True)],
+    ),
+    "order_hex_buffer_flip": (
+        "water_total",
+        "order_hex_buffer",
+        [("ec221000", True), ("64d90100", True), ("f6541100", True)],
+    ),
+    "order_hex_buffer": (
+        "water_total",
+        "order_hex_buffer",
+        [("ec221000", False), ("64d90100", False)],
+    ),
+}
+
+
+def build_rest_objects() -> dict[str, RestObject]:
+    """Return a RestObject without rest API per item, first item per key wins."""
+    rest_objects = {}
+    for device in DEVICELISTS:
+        for item in device:
+            rest_objects.setdefault(item.translation_key, RestObject(None, item))
+    return rest_objects
+
+
+def measure(operations: list, iterations: int, repeat: int) -> dict:
+    """Run a list of zero-argument callables round robin and measure them."""
+    count = len(operations)
+    rounds = max(1, iterations // count)
+
+    def run():
+        for _ in range(rounds):
+            for operation in operations:
+                operation()
+
+    run()  # warm up, e.g. the lazy codecs of the items
+    gc.disable()
+    try:
+        best = min(_timed(run) for _ in range(repeat))
+    finally:
+        gc.enable()
+
+    # peak memory of single operations
+    tracemalloc.start()
+    peaks = []
+    for operation in operations:
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        operation()
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    run()
+    gc.collect()
+    retained = sys.getallocatedblocks() - blocks
+
+    return {
+        "payloads": count,
+        "ops": rounds * count,
+        "ns_per_op": round(best / (rounds * count), 1),
+        "peak_bytes_per_op": round(sum(peaks) / count, 1),
+        "retained_blocks": retained,
+    }
+
+
+def _timed(function) -> int:
+    """Return the duration of a call in ns."""
+    start = time.perf_counter_ns()
+    function()
+    return time.perf_counter_ns() - start
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="json file, default stdout")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace):
+    """Run all microbenchmarks and write the results."""
+    rest_objects = build_rest_objects()
+    results = []
+    for key, (mformat, payloads) in DECODE_CORPORA.items():
+        decode = rest_objects[key].decode
+        operations = [(lambda res=res: decode(res)) for res in payloads]
+        results.append(
+            {
+                "name": f"decode_{key}",
+                "format": mformat,
+                **measure(operations, args.iterations, args.repeat),
+            }
+        )
+    for name, (key, function, arguments) in ENCODE_CORPORA.items():
+        encode = getattr(rest_objects[key], function)
+        operations = [(lambda a=a: encode(*a)) for a in arguments]
+        results.append(
+            {
+                "name": name,
+                "format": "encode",
+                **measure(operations, args.iterations, args.repeat),
+            }
+        )
+    params = {
+        key: value for key, value in vars(args).items() if key != "output"
+    }
+    write_results("codec", params, results, args.output)
+
+
+if __name__ == "__main__":
+    main(parse_args())
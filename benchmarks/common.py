@@ -0,0 +1,63 @@
+"""Helpers shared by the benchmarks."""
+
+import json
+import math
+import platform
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# make the integration importable as custom_components.judo_rest_api
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Return the percentile of values, nearest rank, None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summary(values: list[float], scale: float = 1.0, digits: int = 3) -> dict:
+    """Return p50, p99, max and mean of values, multiplied by scale."""
+    if not values:
+        return {"p50": None, "p99": None, "max": None, "mean": None}
+    return {
+        "p50": round(percentile(values, 50) * scale, digits),
+        "p99": round(percentile(values, 99) * scale, digits),
+        "max": round(max(values) * scale, digits),
+        "mean": round(sum(values) / len(values) * scale, digits),
+    }
+
+
+def integration_version() -> str:
+    """Return the version of the integration from its manifest."""
+    manifest = ROOT / "custom_components" / "judo_rest_api" / "manifest.json"
+    return json.loads(manifest.read_text(encoding="utf-8"))["version"]
+
+
+def write_results(name: str, params: dict, results: list, output: str | None):
+    """Write the results as json to output, or to stdout if omitted.
+
+    The envelope is the same for all benchmarks, so results of different
+    releases can be compared by name and params.
+    """
+    document = {
+        "benchmark": name,
+        "version": integration_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "params": params,
+        "results": results,
+    }
+    text = json.dumps(document, indent=2)
+    if output is None:
+        print(text)  # noqa: T201
+    else:
+        Path(output).write_text(text + "\n", encoding="utf-8")
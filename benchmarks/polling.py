@@ -0,0 +1,238 @@
+"""End-to-end polling benchmark.
+
+Runs MyCoordinator.fetch_data and the RestAPI of one or more config entries
+against simulated devices and measures per poll cycle:
+
+- cycle latency of fetch_data, p50/p99
+- requests and response bytes seen by the simulated device
+- event loop lag, the delay of a timer that should fire every LAG_INTERVAL
+- executor jobs and threads, the integration should not need any
+
+Each entry ticks with the update interval of its coordinator, like in Home
+Assistant, so the poll classes and the scheduler are part of the result.
+The simulated time scale is short, so the response cache is disabled by
+default.
+
+    python -m benchmarks.polling --entries 1,2,4,8 --cycles 20 --output polling.json
+"""
+
+import argparse
+import asyncio
+import copy
+import logging
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+# common puts the repository root on the path, import it first
+from .common import summary, write_results
+
+from custom_components.judo_rest_api.const import CONF
+from custom_components.judo_rest_api.coordinator import MyCoordinator
+from custom_components.judo_rest_api.jdconst import DEVICELISTS
+from custom_components.judo_rest_api.restobject import RestAPI
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import frame
+from judo_simulator import Faults, SimulatedDevice, SimulatorServer
+
+log = logging.getLogger(__name__)
+
+# period of the event loop lag probe in seconds
+LAG_INTERVAL = 0.01
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Default executor counting the submitted jobs and the threads used."""
+
+    def __init__(self) -> None:
+        """Construct CountingExecutor."""
+        super().__init__(thread_name_prefix="bench")
+        self.jobs = 0
+        self.max_threads = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Count and submit a job."""
+        self.jobs += 1
+        future = super().submit(fn, *args, **kwargs)
+        self.max_threads = max(self.max_threads, len(self._threads))
+        return future
+
+
+async def measure_loop_lag(lags: list[float], stop: asyncio.Event):
+    """Record how late a periodic timer fires until stop is set."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+def build_entry(server: SimulatorServer, args: argparse.Namespace):
+    """Return a stand-in config entry for one simulated device."""
+    return SimpleNamespace(
+        entry_id=f"bench_{server.port}",
+        data={
+            CONF.HOST: "127.0.0.1",
+            CONF.PORT: server.port,
+            CONF.USERNAME: "admin",
+            CONF.PASSWORD: "Connectivity",
+            CONF.DEVICE_POSTFIX: str(server.port),
+            CONF.SCAN_INTERVAL: args.scan_interval,
+            CONF.MAX_PARALLEL_REQUESTS: args.max_parallel_requests,
+            CONF.ADAPTIVE_POLLING: False,
+            CONF.CACHE_TTL: args.cache_ttl,
+        },
+    )
+
+
+def build_items() -> list:
+    """Return an own copy of all rest items, the item states are per entry."""
+    return [copy.deepcopy(item) for device in DEVICELISTS for item in device]
+
+
+async def poll_entry(
+    coordinator: MyCoordinator, cycles: int, durations: list[float]
+):
+    """Run the poll cycles of one entry with the interval of its coordinator."""
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    for _ in range(cycles):
+        start = time.perf_counter()
+        await coordinator.fetch_data()
+        durations.append(time.perf_counter() - start)
+        next_tick += coordinator.update_interval.total_seconds()
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+async def run_scenario(
+    hass: HomeAssistant, entries: int, args: argparse.Namespace
+) -> dict:
+    """Poll a number of entries at the same time and return the measurements."""
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        truncate_rate=args.truncate_rate,
+        drop_rate=args.drop_rate,
+    )
+    servers = []
+    for index in range(entries):
+        server = SimulatorServer(
+            SimulatedDevice(seed=args.seed + index),
+            faults=faults,
+            username="admin",
+            password="Connectivity",
+            seed=args.seed + index,
+        )
+        await server.start()
+        servers.append(server)
+
+    apis = []
+    coordinators = []
+    for server in servers:
+        entry = build_entry(server, args)
+        api = RestAPI(config_entry=entry, hass=hass)
+        coordinator = MyCoordinator(
+            hass=hass, my_api=api, api_items=build_items(), p_config_entry=entry
+        )
+        await api.connect()
+        apis.append(api)
+        coordinators.append(coordinator)
+    for server in servers:
+        server.reset_stats()
+
+    executor = CountingExecutor()
+    asyncio.get_running_loop().set_default_executor(executor)
+    threads_before = threading.active_count()
+    lags: list[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(lags, stop))
+    durations: list[float] = []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                poll_entry(coordinator, args.cycles, durations)
+                for coordinator in coordinators
+            )
+        )
+    finally:
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await lag_task
+        for api in apis:
+            await api.close()
+        for server in servers:
+            await server.stop()
+        executor.shutdown(wait=False)
+
+    total_cycles = entries * args.cycles
+    requests = sum(server.stats["requests"] for server in servers)
+    response_bytes = sum(server.stats["bytes"] for server in servers)
+    return {
+        "entries": entries,
+        "cycles": total_cycles,
+        "elapsed_s": round(elapsed, 3),
+        "cycle_latency_ms": summary(durations, scale=1000),
+        "requests_per_cycle": round(requests / total_cycles, 3),
+        "bytes_per_cycle": round(response_bytes / total_cycles, 1),
+        "requests": requests,
+        "bytes": response_bytes,
+        "device_errors": sum(server.stats["errors"] for server in servers),
+        "device_dropped": sum(server.stats["dropped"] for server in servers),
+        "loop_lag_ms": summary(lags, scale=1000),
+        "executor_jobs": executor.jobs,
+        "executor_threads": executor.max_threads,
+        "threads_delta": threading.active_count() - threads_before,
+        "cache": {
+            key: sum(api.cache_metrics[key] for api in apis)
+            for key in ("hits", "misses", "coalesced")
+        },
+        "queue_max_wait_ms": round(
+            max(api.queue_metrics["normal"]["max_wait"] for api in apis) * 1000, 3
+        ),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--entries", default="1,2,4,8", help="comma separated numbers of entries"
+    )
+    parser.add_argument("--cycles", type=int, default=20, help="cycles per entry")
+    parser.add_argument("--scan-interval", type=int, default=1, help="seconds")
+    parser.add_argument("--max-parallel-requests", type=int, default=2)
+    parser.add_argument("--cache-ttl", type=float, default=0.0, help="seconds")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default=None, help="json file, default stdout")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace):
+    """Run all scenarios and write the results."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        frame.async_setup(hass)
+        results = []
+        for entries in (int(value) for value in args.entries.split(",")):
+            log.info("Polling %s entries", entries)
+            results.append(await run_scenario(hass, entries, args))
+    params = {
+        key: value for key, value in vars(args).items() if key != "output"
+    }
+    write_results("polling", params, results, args.output)
+
+
+if __name__ == "__main__":
+    # the integration logs every failed read, which would measure the logging
+    logging.getLogger().setLevel(logging.ERROR)
+    log.setLevel(logging.INFO)
+    asyncio.run(main(parse_args()))
@@ -5,12 +5,15 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import entity_registry as er
 
 from .configentry import MyConfigEntry, MyData
 from .const import CONF, CONST
-from .jdconst import DEVICELISTS
+from .capabilities import build_item_list
 from .coordinator import MyCoordinator
 from .restobject import RestAPI
+from .staticstore import async_get_static_store
 
 logging.basicConfig()
 log = logging.getLogger(__name__)
@@ -34,16 +37,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
     restapi = RestAPI(config_entry=entry, hass=hass)
     # await restapi.login()
 
-    itemlist = []
-
-    for device in DEVICELISTS:
-        for item in device:
-            itemlist.append(item)
+    # staged startup: only the device type probe gates the setup, all other
+    # values are read by a refresh in the background after the entities exist
+    if await restapi.connect() is None:
+        await restapi.close()
+        raise ConfigEntryNotReady(
+            f"Judo Water treatment at {entry.data[CONF.HOST]} not reachable"
+        )
+
+    # only the registers of this device type, without the ones it did not answer
+    unsupported = await async_get_static_store(hass).async_get_unsupported(
+        entry.entry_id, restapi.get_devicetype()
+    )
+    itemlist = build_item_list(restapi.get_devicetype(), unsupported)
+    remove_unsupported_entities(hass, entry, itemlist)
 
     coordinator = MyCoordinator(
-        hass=hass, my_api=restapi, api_items=itemlist, p_config_entry=entry
+        hass=hass,
+        my_api=restapi,
+        api_items=itemlist,
+        p_config_entry=entry,
+        unsupported_addresses=unsupported,
     )
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_load_static_registers()
 
     entry.runtime_data = MyData(
         rest_api=restapi,
@@ -61,11 +77,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), "judo_rest_api first refresh"
+    )
+
     log.info("Init done")
 
     return True
 
 
+def remove_unsupported_entities(
+    hass: HomeAssistant, entry: MyConfigEntry, itemlist: list
+) -> None:
+    """Remove the registry entries of items the device does not support.
+
+    Otherwise they would be restored as unavailable entities.
+    """
+    # same unique id as in MyEntity
+    unique_ids = {
+        CONST.DOMAIN + "_" + item.device + "_" + item.translation_key
+        for item in itemlist
+    }
+    registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if entity_entry.unique_id not in unique_ids:
+            log.info("Remove unsupported entity %s", entity_entry.entity_id)
+            registry.async_remove(entity_entry.entity_id)
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update listener."""
     await hass.config_entries.async_reload(
@@ -78,7 +117,7 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: MyConfigEntry):
 
     new_data = {**config_entry.data}
 
-    if config_entry.version > 1:
+    if config_entry.version > 6:
         # This means the user has downgraded from a future version
         return True
 
@@ -90,8 +129,26 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: MyConfigEntry):
         log.warning("Version <2 detected")
         new_data[CONF.SCAN_INTERVAL] = CONST.SCAN_INTERVAL
 
+    if config_entry.version < 3:
+        log.warning("Version <3 detected")
+        new_data[CONF.MAX_PARALLEL_REQUESTS] = CONST.MAX_PARALLEL_REQUESTS
+
+    if config_entry.version < 4:
+        log.warning("Version <4 detected")
+        new_data[CONF.ADAPTIVE_POLLING] = CONST.ADAPTIVE_POLLING
+        new_data[CONF.MIN_SCAN_INTERVAL] = CONST.MIN_SCAN_INTERVAL
+        new_data[CONF.MAX_SCAN_INTERVAL] = CONST.MAX_SCAN_INTERVAL
+
+    if config_entry.version < 5:
+        log.warning("Version <5 detected")
+        new_data[CONF.CACHE_TTL] = CONST.CACHE_TTL
+
+    if config_entry.version < 6:
+        log.warning("Version <6 detected")
+        new_data[CONF.DEBUG_ATTRIBUTES] = CONST.DEBUG_ATTRIBUTES
+
     hass.config_entries.async_update_entry(
-        config_entry, data=new_data, minor_version=1, version=2
+        config_entry, data=new_data, minor_version=1, version=6
     )
     return True
 
@@ -101,6 +158,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # This is called when an entry/configured device is to be removed. The class
     # needs to unload itself, and remove callbacks. See the classes for further
     # details
-    entry.runtime_data.rest_api.close()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    await entry.runtime_data.rest_api.close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored registers of a removed entry."""
+    store = async_get_static_store(hass)
+    await store.async_load()
+    store.clear_unsupported(entry.entry_id)
+    store.remove_entry(entry.entry_id)
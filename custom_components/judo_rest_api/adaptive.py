@@ -0,0 +1,68 @@
+"""Adaptive scan interval.
+
+Adjusts the scan interval of the coordinator to the activity and the
+health of the device: fast polling while water is flowing, a long interval
+while the device is idle and an exponential backoff while it is unreachable.
+"""
+
+import logging
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+
+class AdaptiveInterval:
+    """AdaptiveInterval.
+
+    Holds the effective scan interval, bounded by a floor and a ceiling.
+    """
+
+    def __init__(
+        self, interval: float, floor: float, ceiling: float, enabled: bool
+    ) -> None:
+        """Construct AdaptiveInterval.
+
+        :param interval: configured scan interval in seconds
+        :param floor: shortest interval in seconds, used while water is flowing
+        :param ceiling: longest interval in seconds, used while idle or unreachable
+        :param enabled: False keeps the configured interval
+        """
+        self._configured = interval
+        self._floor = min(floor, interval)
+        self._ceiling = max(ceiling, interval)
+        self._enabled = enabled
+        self._interval = interval
+        self._failures = 0
+
+    @property
+    def interval(self) -> float:
+        """Return the effective scan interval in seconds."""
+        return self._interval
+
+    def update(self, reachable: bool, active: bool | None) -> float:
+        """Adjust the interval after a poll cycle and return it.
+
+        :param reachable: False if the device did not answer in this cycle
+        :param active: True if water is flowing, False if idle, None if unknown
+        """
+        if not self._enabled:
+            return self._interval
+
+        interval = self._interval
+        if not reachable:
+            self._failures += 1
+            interval = self._configured * 2**self._failures
+        elif self._failures > 0:
+            self._failures = 0
+            interval = self._floor if active else self._configured
+        elif active is True:
+            interval = self._floor
+        elif active is False:
+            # relax step by step, a short break of the flow keeps polling fast
+            interval = interval * 2
+
+        interval = max(self._floor, min(self._ceiling, interval))
+        if interval != self._interval:
+            log.debug("Scan interval changed to %s s", str(interval))
+            self._interval = interval
+        return self._interval
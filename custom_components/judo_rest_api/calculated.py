@@ -0,0 +1,97 @@
+"""Calculated values.
+
+Values derived from other rest items without additional requests to the
+device. A calculated item has the type TYPES.SENSOR_CALC and declares in its
+params the calculation ("calc") and the item it is derived from ("source").
+"""
+
+import logging
+from collections import deque
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+
+class FlowRateCalculator:
+    """FlowRateCalculator.
+
+    Calculates the flow rate in l/min from the last samples of a volume
+    counter in m³, held in a small ring buffer.
+    """
+
+    # number of samples the rate is averaged over
+    WINDOW = 4
+    # samples older than this are dropped, e.g. after missed cycles
+    MAX_AGE = 900
+
+    def __init__(self, counter_range: float) -> None:
+        """Construct FlowRateCalculator.
+
+        :param counter_range: value at which the source counter rolls over
+        :type counter_range: float
+        """
+        self._counter_range = counter_range
+        self._samples: deque[tuple[float, float]] = deque(maxlen=self.WINDOW)
+        self._offset = 0.0
+
+    def add_sample(self, timestamp: float, value: float) -> float | None:
+        """Add a sample of the counter and return the flow rate.
+
+        :param timestamp: monotonic time of the sample in seconds
+        :param value: counter value in m³
+        """
+        if self._samples:
+            last_timestamp, last_value = self._samples[-1]
+            if timestamp <= last_timestamp:
+                return self.value
+            if value + self._offset < last_value:
+                if last_value - self._offset - value > self._counter_range / 2:
+                    # counter rolled over, continue counting above the range
+                    self._offset += self._counter_range
+                else:
+                    # counter was reset, the old samples are meaningless
+                    log.info("Counter reset detected, flow rate restarted")
+                    self._samples.clear()
+                    self._offset = 0.0
+        self._samples.append((timestamp, value + self._offset))
+        while timestamp - self._samples[0][0] > self.MAX_AGE:
+            self._samples.popleft()
+        return self.value
+
+    @property
+    def value(self) -> float | None:
+        """Return the flow rate in l/min, None if not enough samples are known."""
+        if len(self._samples) < 2:
+            return None
+        first_timestamp, first_value = self._samples[0]
+        last_timestamp, last_value = self._samples[-1]
+        liters = (last_value - first_value) * 1000
+        minutes = (last_timestamp - first_timestamp) / 60
+        return round(liters / minutes, 2)
+
+
+# values set by the coordinator itself instead of a calculator
+COORDINATOR_VALUES = (
+    "scan_interval",
+    "cycle_duration",
+    "request_count",
+    "request_errors",
+    "request_latency",
+    "last_success",
+)
+
+CALCULATORS = {
+    "flow_rate": FlowRateCalculator,
+}
+
+
+def build_calculator(rest_item, source_item):
+    """Build the calculator of a calculated item from the item it is derived from."""
+    calculator = CALCULATORS.get(rest_item.params.get("calc"))
+    if calculator is None:
+        log.warning("Unknown calculation for %s", rest_item.translation_key)
+        return None
+    divider = 1
+    if source_item.params is not None:
+        divider = source_item.params.get("divider", 1)
+    return calculator(counter_range=2 ** (8 * source_item.read_bytes) / divider)
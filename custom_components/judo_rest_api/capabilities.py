@@ -0,0 +1,54 @@
+"""Device capabilities.
+
+Selects the rest items a device supports: the register map of its device
+type (see MODEL_UNSUPPORTED_ADDRESSES) minus the addresses learned to be
+unsupported, i.e. the device answered them repeatedly with an error status
+like 404 or with empty data.
+"""
+
+import logging
+
+from .const import TYPES
+from .items import RestItem
+from .jdconst import DEVICELISTS, MODEL_UNSUPPORTED_ADDRESSES
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+
+def build_item_list(
+    device_type: str | None, unsupported_addresses=()
+) -> list[RestItem]:
+    """Return the rest items supported by a device.
+
+    :param device_type: device type as read from FF00, None if unknown
+    :param unsupported_addresses: addresses learned to be unsupported
+    """
+    excluded = set(MODEL_UNSUPPORTED_ADDRESSES.get(device_type, ()))
+    excluded.update(unsupported_addresses)
+
+    items = [
+        item
+        for device in DEVICELISTS
+        for item in device
+        if item.address_read not in excluded and item.address_write not in excluded
+    ]
+
+    # calculated items need the item they are derived from
+    keys = {item.translation_key for item in items}
+    result = []
+    for item in items:
+        source = None
+        if item.type == TYPES.SENSOR_CALC and item.params is not None:
+            source = item.params.get("source")
+        if source is not None and source not in keys:
+            continue
+        result.append(item)
+
+    if excluded:
+        log.info(
+            "Addresses not supported by device type %s: %s",
+            str(device_type),
+            ", ".join(sorted(excluded)),
+        )
+    return result
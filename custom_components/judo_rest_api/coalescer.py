@@ -0,0 +1,82 @@
+"""Write coalescer.
+
+Collects writes to one rest item within a short window and sends only the
+last requested value, e.g. while a slider is dragged in the UI.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+
+class WriteCoalescer:
+    """WriteCoalescer.
+
+    Every caller within the window waits for the one write of the last
+    value and gets its result.
+    """
+
+    def __init__(
+        self, write: Callable[[object], Awaitable], window: float
+    ) -> None:
+        """Construct WriteCoalescer.
+
+        :param write: coroutine function writing a value to the device
+        :param window: seconds to wait for further values before writing
+        """
+        self._write = write
+        self._window = window
+        self._value = None
+        self._future: asyncio.Future | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._deadline = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def async_write(self, value):
+        """Request a write of value and wait until the coalesced write is done."""
+        loop = asyncio.get_running_loop()
+        self._value = value
+        if self._future is None:
+            self._future = loop.create_future()
+            # the window is restarted by every new value, but not beyond
+            # three windows, so a long drag still writes in between
+            self._deadline = loop.time() + 3 * self._window
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = loop.call_at(
+            min(loop.time() + self._window, self._deadline), self._flush
+        )
+        return await asyncio.shield(self._future)
+
+    def _flush(self):
+        """Send the last value, called when the window is over."""
+        self._timer = None
+        future, self._future = self._future, None
+        if future is None:
+            return
+        self._task = asyncio.get_running_loop().create_task(
+            self._send(future, self._value)
+        )
+
+    async def _send(self, future: asyncio.Future, value):
+        """Write the value and resolve all waiting callers."""
+        try:
+            result = await self._write(value)
+        except Exception as exc:  # noqa: BLE001
+            log.warning("Coalesced write failed")
+            if not future.done():
+                future.set_exception(exc)
+            return
+        if not future.done():
+            future.set_result(result)
+
+    async def async_flush(self):
+        """Send a pending value immediately, e.g. when the entity is removed."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._flush()
+        if self._task is not None:
+            await asyncio.shield(self._task)
@@ -0,0 +1,127 @@
+"""Codec.
+
+Decoder and encoder of a REST item, compiled once from the item definition.
+The offsets, the divider and the format specific decode function are looked up
+when the codec is built, so decoding a response only slices and converts.
+"""
+
+import logging
+from datetime import datetime
+
+from .const import FORMATS
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+
+class ItemCodec:
+    """ItemCodec.
+
+    Holds the precomputed layout of one RestItem inside the response of its
+    address and the functions to decode and encode its value.
+    """
+
+    __slots__ = ("_rest_item", "_start", "_end", "_divider", "_int_mask", "_decode")
+
+    def __init__(self, rest_item) -> None:
+        """Compile the codec of a rest item.
+
+        :param rest_item: definition of rest item
+        :type rest_item: RestItem
+        """
+        self._rest_item = rest_item
+        self._start = rest_item.read_index * 2
+        self._end = self._start + rest_item.read_bytes * 2
+        self._divider = 1
+        if rest_item.params is not None:
+            self._divider = rest_item.params.get("divider", 1)
+        self._int_mask = "%0." + str(rest_item.write_bytes * 2) + "X"
+
+        match rest_item.format:
+            case FORMATS.NUMBER:
+                self._decode = self._decode_number
+            case FORMATS.SW_VERSION:
+                self._decode = self._decode_sw_version
+            case FORMATS.TIMESTAMP:
+                self._decode = self._decode_timestamp
+            case FORMATS.TEXT:
+                self._decode = self._decode_text
+            case FORMATS.STATUS:
+                self._decode = self._decode_status
+            case FORMATS.SWITCH | FORMATS.BUTTON | FORMATS.STATISTICS:
+                self._decode = self._decode_none
+            case _:
+                self._decode = self._decode_unknown
+
+    @property
+    def divider(self):
+        """Return the divider of the item."""
+        return self._divider
+
+    def payload(self, res: str) -> bytes | None:
+        """Return the bytes of the item out of a raw response, big endian order."""
+        if res is None:
+            return None
+        data = bytes.fromhex(res[self._start : self._end])
+        if len(data) == 0:
+            return None
+        return data
+
+    def decode(self, res: str):
+        """Decode the value of the item from a raw response of its address."""
+        data = self.payload(res)
+        if data is None:
+            return None
+        return self._decode(data)
+
+    def decode_number(self, res: str):
+        """Decode the item as number from a raw response, regardless of its format."""
+        data = self.payload(res)
+        if data is None:
+            return None
+        return self._decode_number(data)
+
+    def _decode_number(self, data: bytes):
+        return float(int.from_bytes(data, "little") / self._divider)
+
+    def _decode_sw_version(self, data: bytes):
+        # little endian: major, minor, letter
+        data = data[::-1]
+        return str(data[0]) + "." + str(data[1]).zfill(2) + data[2:3].decode()
+
+    def _decode_timestamp(self, data: bytes):
+        return str(datetime.fromtimestamp(int.from_bytes(data, "big")))
+
+    def _decode_text(self, data: bytes):
+        return data.decode()
+
+    def _decode_status(self, data: bytes):
+        return self._rest_item.get_translation_key_from_number(
+            int.from_bytes(data, "little")
+        )
+
+    def _decode_none(self, data: bytes):
+        return None
+
+    def _decode_unknown(self, data: bytes):
+        log.warning(
+            "Unknown format: %s in %s",
+            str(self._rest_item.type),
+            str(self._rest_item.translation_key),
+        )
+        return None
+
+    @staticmethod
+    def order_hex_buffer(buffer: str, flip) -> str:
+        """brings a hex buffer in the right order"""
+        if flip is True:
+            return bytes.fromhex(buffer)[::-1].hex()
+        return bytes.fromhex(buffer).hex()
+
+    def encode_int(self, number: int, flip) -> str:
+        """format int message as hex buffer to be sent to REST API"""
+        return self.order_hex_buffer(self._int_mask % number, flip)
+
+    def encode_str(self, text: str, flip) -> str:
+        """format str message as hex buffer to be sent to REST API"""
+        return self.order_hex_buffer(text.encode("utf-8").hex(), flip)
@@ -0,0 +1,137 @@
+"""Command queue.
+
+Serializes the requests to one device. Writes and button presses use the
+high priority lane and overtake the polling requests in the normal lane.
+Every command has a deadline, a command still waiting after its deadline
+is dropped instead of being sent late.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+
+from .const import LANE
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+
+class CommandQueue:
+    """CommandQueue.
+
+    A priority queue worked off by a fixed number of workers, the number of
+    requests in flight to the device.
+    """
+
+    def __init__(self, workers: int) -> None:
+        """Construct CommandQueue.
+
+        :param workers: maximum number of commands executed at the same time
+        :type workers: int
+        """
+        self._workers = workers
+        self._queue: asyncio.PriorityQueue | None = None
+        self._tasks: list[asyncio.Task] = []
+        # set by async_stop, no workers are started afterwards
+        self._closed = False
+        self._sequence = itertools.count()
+        self._metrics = {
+            lane: {"executed": 0, "expired": 0, "last_wait": 0.0, "max_wait": 0.0}
+            for lane in (LANE.HIGH, LANE.NORMAL)
+        }
+
+    def _start(self):
+        """Start the queue and its workers on first use."""
+        if self._closed:
+            return
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        if not self._tasks:
+            loop = asyncio.get_running_loop()
+            self._tasks = [
+                loop.create_task(self._worker()) for _ in range(self._workers)
+            ]
+
+    async def async_submit(
+        self, command: Callable[[], Awaitable], lane: int, deadline: float
+    ):
+        """Queue a command and return its result.
+
+        None is returned if its deadline passed or the queue is stopped.
+
+        :param command: coroutine function sending the request
+        :param lane: LANE.HIGH or LANE.NORMAL
+        :param deadline: seconds the command may wait in the queue
+        """
+        if self._closed:
+            return None
+        self._start()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        now = loop.time()
+        await self._queue.put(
+            (lane, next(self._sequence), now, now + deadline, command, future)
+        )
+        return await future
+
+    async def _worker(self):
+        """Execute the queued commands in order of their priority."""
+        loop = asyncio.get_running_loop()
+        while True:
+            lane, _seq, queued, deadline, command, future = await self._queue.get()
+            try:
+                if future.done():
+                    # caller is gone, e.g. cancelled by a timeout
+                    continue
+                now = loop.time()
+                metrics = self._metrics[lane]
+                if now > deadline:
+                    metrics["expired"] += 1
+                    log.warning("Command dropped, deadline exceeded in queue")
+                    future.set_result(None)
+                    continue
+                wait = now - queued
+                metrics["executed"] += 1
+                metrics["last_wait"] = wait
+                metrics["max_wait"] = max(metrics["max_wait"], wait)
+                try:
+                    result = await command()
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    @property
+    def depth(self) -> int:
+        """Return the number of waiting commands."""
+        if self._queue is None:
+            return 0
+        return self._queue.qsize()
+
+    @property
+    def metrics(self) -> dict:
+        """Return queue depth and wait times per lane."""
+        return {
+            "depth": self.depth,
+            "high": dict(self._metrics[LANE.HIGH]),
+            "normal": dict(self._metrics[LANE.NORMAL]),
+        }
+
+    async def async_stop(self):
+        """Stop the workers, commands submitted afterwards are not executed."""
+        self._closed = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        while self._queue is not None and not self._queue.empty():
+            *_command, future = self._queue.get_nowait()
+            future.cancel()
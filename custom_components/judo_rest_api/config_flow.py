@@ -38,7 +38,7 @@ async def validate_input(data: dict) -> dict[str, Any]:
 class ConfigFlow(config_entries.ConfigFlow, domain=CONST.DOMAIN):  # pylint: disable=W0223
     """Class config flow."""
 
-    VERSION = 2
+    VERSION = 6
     # Pick one of the available connection classes in homeassistant/config_entries.py
     # This tells HA if it should be asking for updates, or it'll be notified of updates
     # automatically. This example uses PUSH, as the dummy hub will notify HA of
@@ -66,6 +66,25 @@ class ConfigFlow(config_entries.ConfigFlow, domain=CONST.DOMAIN):  # pylint: dis
                 vol.Optional(schema=CONF.PASSWORD, default="Connectivity"): str,
                 vol.Optional(schema=CONF.DEVICE_POSTFIX, default=""): str,
                 vol.Optional(schema=CONF.SCAN_INTERVAL, default="60"): str,
+                vol.Optional(
+                    schema=CONF.MAX_PARALLEL_REQUESTS,
+                    default=CONST.MAX_PARALLEL_REQUESTS,
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+                vol.Optional(
+                    schema=CONF.ADAPTIVE_POLLING, default=CONST.ADAPTIVE_POLLING
+                ): bool,
+                vol.Optional(
+                    schema=CONF.MIN_SCAN_INTERVAL, default=CONST.MIN_SCAN_INTERVAL
+                ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                vol.Optional(
+                    schema=CONF.MAX_SCAN_INTERVAL, default=CONST.MAX_SCAN_INTERVAL
+                ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                vol.Optional(
+                    schema=CONF.CACHE_TTL, default=CONST.CACHE_TTL
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    schema=CONF.DEBUG_ATTRIBUTES, default=CONST.DEBUG_ATTRIBUTES
+                ): bool,
             }
         )
 
@@ -93,6 +112,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=CONST.DOMAIN):  # pylint: dis
                 CONF.PASSWORD: "password",
                 CONF.DEVICE_POSTFIX: "Device-Postfix",
                 CONF.SCAN_INTERVAL: "scan_interval",
+                CONF.MAX_PARALLEL_REQUESTS: "max_parallel_requests",
+                CONF.ADAPTIVE_POLLING: "adaptive_polling",
+                CONF.MIN_SCAN_INTERVAL: "min_scan_interval",
+                CONF.MAX_SCAN_INTERVAL: "max_scan_interval",
+                CONF.CACHE_TTL: "cache_ttl",
+                CONF.DEBUG_ATTRIBUTES: "debug_attributes",
             },
         )
 
@@ -133,6 +158,42 @@ class ConfigFlow(config_entries.ConfigFlow, domain=CONST.DOMAIN):  # pylint: dis
                     schema=CONF.SCAN_INTERVAL,
                     default=reconfigure_entry.data[CONF.SCAN_INTERVAL],
                 ): str,
+                vol.Optional(
+                    schema=CONF.MAX_PARALLEL_REQUESTS,
+                    default=reconfigure_entry.data.get(
+                        CONF.MAX_PARALLEL_REQUESTS, CONST.MAX_PARALLEL_REQUESTS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+                vol.Optional(
+                    schema=CONF.ADAPTIVE_POLLING,
+                    default=reconfigure_entry.data.get(
+                        CONF.ADAPTIVE_POLLING, CONST.ADAPTIVE_POLLING
+                    ),
+                ): bool,
+                vol.Optional(
+                    schema=CONF.MIN_SCAN_INTERVAL,
+                    default=reconfigure_entry.data.get(
+                        CONF.MIN_SCAN_INTERVAL, CONST.MIN_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                vol.Optional(
+                    schema=CONF.MAX_SCAN_INTERVAL,
+                    default=reconfigure_entry.data.get(
+                        CONF.MAX_SCAN_INTERVAL, CONST.MAX_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                vol.Optional(
+                    schema=CONF.CACHE_TTL,
+                    default=reconfigure_entry.data.get(
+                        CONF.CACHE_TTL, CONST.CACHE_TTL
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    schema=CONF.DEBUG_ATTRIBUTES,
+                    default=reconfigure_entry.data.get(
+                        CONF.DEBUG_ATTRIBUTES, CONST.DEBUG_ATTRIBUTES
+                    ),
+                ): bool,
             }
         )
 
@@ -147,6 +208,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=CONST.DOMAIN):  # pylint: dis
                 CONF.PASSWORD: "password",
                 CONF.DEVICE_POSTFIX: "Device-Postfix",
                 CONF.SCAN_INTERVAL: "scan_interval",
+                CONF.MAX_PARALLEL_REQUESTS: "max_parallel_requests",
+                CONF.ADAPTIVE_POLLING: "adaptive_polling",
+                CONF.MIN_SCAN_INTERVAL: "min_scan_interval",
+                CONF.MAX_SCAN_INTERVAL: "max_scan_interval",
+                CONF.CACHE_TTL: "cache_ttl",
+                CONF.DEBUG_ATTRIBUTES: "debug_attributes",
             },
         )
 
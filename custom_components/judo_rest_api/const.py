@@ -21,6 +21,12 @@ class ConfConstants:
     USERNAME = CONF_USERNAME
     DEVICE_POSTFIX = "Device-Postfix"
     SCAN_INTERVAL = CONF_SCAN_INTERVAL
+    MAX_PARALLEL_REQUESTS = "max_parallel_requests"
+    ADAPTIVE_POLLING = "adaptive_polling"
+    MIN_SCAN_INTERVAL = "min_scan_interval"
+    MAX_SCAN_INTERVAL = "max_scan_interval"
+    CACHE_TTL = "cache_ttl"
+    DEBUG_ATTRIBUTES = "debug_attributes"
 
 
 CONF = ConfConstants()
@@ -32,6 +38,14 @@ class MainConstants:
 
     DOMAIN = "judo_rest_api"
     SCAN_INTERVAL = "60"  # timedelta(seconds=60))
+    MAX_PARALLEL_REQUESTS = 2
+    ADAPTIVE_POLLING = False
+    MIN_SCAN_INTERVAL = 10
+    MAX_SCAN_INTERVAL = 600
+    CACHE_TTL = 5
+    DEBUG_ATTRIBUTES = False
+    # seconds to coalesce writes of number entities, "debounce" in the item params
+    WRITE_DEBOUNCE = 0.5
     UNIQUE_ID = "unique_id"
     APPID = 100
 
@@ -39,6 +53,52 @@ class MainConstants:
 CONST = MainConstants()
 
 
+@dataclass(frozen=True)
+class RestConstants:
+    """Constants used for the HTTP connection to the REST API."""
+
+    READ_TIMEOUT = 10
+    WRITE_TIMEOUT = 2
+    KEEPALIVE_TIMEOUT = 30
+    # consecutive failed requests until the circuit breaker opens
+    FAILURE_THRESHOLD = 3
+    # cheap register read to probe a device while the circuit breaker is open
+    PROBE_COMMAND = "FF00"
+    # seconds a command may wait in the command queue
+    READ_DEADLINE = 30
+    WRITE_DEADLINE = 10
+    # answers showing that the device does not implement an address
+    UNSUPPORTED_STATUSES = (400, 404, 405, 501)
+    # consecutive such answers until an address is dropped from polling
+    UNSUPPORTED_THRESHOLD = 3
+
+
+REST = RestConstants()
+
+
+@dataclass(frozen=True)
+class HealthConstants:
+    """Health states of the connection to a device."""
+
+    HEALTHY = "healthy"
+    DEGRADED = "degraded"
+    OPEN = "open"
+
+
+HEALTH = HealthConstants()
+
+
+@dataclass(frozen=True)
+class LaneConstants:
+    """Priority lanes of the command queue, lower values are sent first."""
+
+    HIGH = 0
+    NORMAL = 1
+
+
+LANE = LaneConstants()
+
+
 @dataclass(frozen=True)
 class FormatConstants:
     """Format constants."""
@@ -51,6 +111,7 @@ class FormatConstants:
     BUTTON = "Button"
     TIMESTAMP = "Timestamp"
     SW_VERSION = "SW_Version"
+    STATISTICS = "Statistics"
 
 
 FORMATS = FormatConstants()
@@ -84,6 +145,27 @@ class DeviceConstants:
 
 DEVICES = DeviceConstants()
 
+
+@dataclass(frozen=True)
+class PollConstants:
+    """Poll classes of the rest items, declared as "poll" in the item params."""
+
+    STATIC = "static"
+    SLOW = "slow"
+    NORMAL = "normal"
+    FAST = "fast"
+
+
+POLL = PollConstants()
+
+# poll period of each class as multiple of the scan interval,
+# static items are read once
+POLL_FACTORS = {
+    POLL.FAST: 0.5,
+    POLL.NORMAL: 1,
+    POLL.SLOW: 10,
+}
+
 COMMANDS = {
     "Geraetetyp": "FF00",
     "Geraetenummer": "0600",
@@ -2,20 +2,37 @@
 
 import asyncio
 import logging
-from datetime import timedelta
+import math
+import time
+from collections import deque
+from datetime import datetime, timedelta
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.translation import async_get_translations
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
+from .adaptive import AdaptiveInterval
+from .calculated import COORDINATOR_VALUES, build_calculator
 from .configentry import MyConfigEntry
-from .const import CONF, CONST, TYPES
+from .const import CONF, CONST, POLL, POLL_FACTORS, REST, TYPES
 from .items import RestItem
+from .metrics import RECENT_SIZE
 from .restobject import RestAPI, RestObject
+from .staticstore import (
+    REVALIDATE_ADDRESSES,
+    REVALIDATE_DELAY,
+    async_get_static_store,
+)
+from .statistics import STATISTICS_COMMANDS, StatisticsEngine
 
 logging.basicConfig()
 log = logging.getLogger(__name__)
 
+# water is flowing while this item changes, used for the adaptive scan interval
+ACTIVITY_ITEM = "water_total"
+
 
 class MyCoordinator(DataUpdateCoordinator):
     """My custom coordinator."""
@@ -26,113 +43,601 @@ class MyCoordinator(DataUpdateCoordinator):
         my_api: RestAPI,
         api_items: RestItem,
         p_config_entry: MyConfigEntry,
+        unsupported_addresses=(),
     ) -> None:
-        """Initialize my coordinator."""
+        """Initialize my coordinator.
+
+        api_items are the items supported by the device, see capabilities.py,
+        unsupported_addresses the addresses already learned to be unsupported.
+        """
+        self._scan_interval = int(p_config_entry.data[CONF.SCAN_INTERVAL])
+        self._tick_factor = self._get_tick_factor(api_items)
+        self._adaptive = AdaptiveInterval(
+            interval=self._scan_interval,
+            floor=int(
+                p_config_entry.data.get(
+                    CONF.MIN_SCAN_INTERVAL, CONST.MIN_SCAN_INTERVAL
+                )
+            ),
+            ceiling=int(
+                p_config_entry.data.get(
+                    CONF.MAX_SCAN_INTERVAL, CONST.MAX_SCAN_INTERVAL
+                )
+            ),
+            enabled=bool(
+                p_config_entry.data.get(CONF.ADAPTIVE_POLLING, CONST.ADAPTIVE_POLLING)
+            ),
+        )
         super().__init__(
             hass,
             log,
             name="judo_rest_api-coordinator",
-            update_interval=timedelta(
-                seconds=int(p_config_entry.data[CONF.SCAN_INTERVAL])
-            ),
-            # Set always_update to `False` if the data returned from the
-            # api can be compared via `__eq__` to avoid duplicate updates
-            # being dispatched to listeners
-            always_update=True,
+            update_interval=timedelta(seconds=self._scan_interval * self._tick_factor),
+            # the data is a dict of all item states, so listeners are only
+            # called when at least one value changed
+            always_update=False,
         )
         self._rest_api = my_api
+        self._statistics = StatisticsEngine(my_api)
         self._device = None
         self._restitems = api_items
         self._number_of_items = len(api_items)
         self._config_entry = p_config_entry
-        self._cached_device_info = {}
+        self._cached_device_info = {
+            "sw_version": None,
+            "model": None,
+            "serial_number": None,
+        }
+        self._device_info_key = None
+        self._translations = None
+        self._translations_language = None
+        # translation keys of the items whose value changed in the last cycle
+        self._changed_items: set[str] = set()
+
+        # first item wins for duplicated keys, like the former linear search
+        self._items_by_key: dict[str, RestItem] = {}
+        for item in self._restitems:
+            self._items_by_key.setdefault(item.translation_key, item)
+
+        # one long-lived RestObject per item, shared by the coordinator and the entities
+        self._rest_objects: dict[str, RestObject] = {
+            item.translation_key: RestObject(self._rest_api, item)
+            for item in self._restitems
+        }
+
+        # items sharing one address_read are decoded from one response
+        self._address_groups: dict[str, list[int]] = {}
+        for index, item in enumerate(self._restitems):
+            if item.address_read is None or item.type in (
+                TYPES.SELECT_NOIF,
+                TYPES.BUTTON,
+            ):
+                continue
+            self._address_groups.setdefault(item.address_read, []).append(index)
+
+        # poll scheduler: an address is polled with the fastest class of its items
+        self._address_poll: dict[str, str] = {
+            address: self._address_poll_class(indices)
+            for address, indices in self._address_groups.items()
+        }
+        self._next_due: dict[str, float] = dict.fromkeys(self._address_groups, 0.0)
+        # time of the last successful read of each address
+        self._read_times: dict[str, float] = {}
+        # addresses answered in the current cycle, from the device or the cache
+        self._answered: set[str] = set()
+        # last raw response of each address, for diagnostics
+        self._raw_responses: dict[str, str] = {}
+        # static registers persisted across restarts, see staticstore.py
+        self._static_store = async_get_static_store(hass)
+        self._static_addresses = [
+            address
+            for address, poll_class in self._address_poll.items()
+            if poll_class == POLL.STATIC
+        ]
+        self._saved_static: dict[str, str] = {}
+        # restored registers waiting to be read again from the device
+        self._restored_static: dict[str, str] = {}
+        # addresses the device does not implement, dropped from the poll plan
+        self._unsupported: set[str] = set(unsupported_addresses)
+        self._unsupported_saved = True
+        # the items of these addresses were not created, see capabilities.py
+        self._excluded_addresses = frozenset(unsupported_addresses)
+        # durations of the last poll cycles in seconds
+        self._cycle_durations: deque[float] = deque(maxlen=RECENT_SIZE)
+        self._activity_value = None
+
+        # calculated items, derived from other items without own requests
+        self._calculations = []
+        # items showing values of the coordinator, like the effective scan interval
+        self._coordinator_items: dict[str, list[RestItem]] = {}
+        for item in self._restitems:
+            if item.type != TYPES.SENSOR_CALC or item.params is None:
+                continue
+            if item.params.get("calc") in COORDINATOR_VALUES:
+                self._coordinator_items.setdefault(item.params["calc"], []).append(
+                    item
+                )
+                continue
+            source = self._items_by_key.get(item.params.get("source"))
+            if source is None:
+                log.warning("No source item for %s", item.translation_key)
+                continue
+            calculator = build_calculator(item, source)
+            if calculator is not None:
+                self._calculations.append((item, source, calculator))
+
+    @staticmethod
+    def _get_tick_factor(api_items) -> float:
+        """Return the coordinator interval relative to the scan interval.
+
+        The coordinator ticks with the period of the fastest poll class in use.
+        """
+        factors = [
+            POLL_FACTORS[item.poll_class]
+            for item in api_items
+            if item.poll_class in POLL_FACTORS
+        ]
+        return min(factors, default=1)
+
+    def _address_poll_class(self, indices: list[int]) -> str:
+        """Return the fastest poll class of the items of one address."""
+        poll_classes = {self._restitems[index].poll_class for index in indices}
+        for poll_class in (POLL.FAST, POLL.NORMAL, POLL.SLOW):
+            if poll_class in poll_classes:
+                return poll_class
+        return POLL.STATIC
+
+    def _due_addresses(self, now: float) -> list[str]:
+        """Return the addresses to be polled in this tick."""
+        # half a tick tolerance, so jitter of the timer does not skip a poll
+        tolerance = self.update_interval.total_seconds() / 2
+        return [
+            address
+            for address, next_due in self._next_due.items()
+            if next_due - now <= tolerance
+        ]
+
+    def _schedule_address(self, address: str, now: float):
+        """Schedule the next poll of an address after it was polled."""
+        poll_class = self._address_poll[address]
+        if poll_class == POLL.STATIC:
+            # static values are read once, retried slowly while one is missing
+            if all(
+                self._restitems[index].state is not None
+                for index in self._address_groups[address]
+            ):
+                self._next_due[address] = math.inf
+            else:
+                self._next_due[address] = (
+                    now + self._scan_interval * POLL_FACTORS[POLL.SLOW]
+                )
+            return
+        self._next_due[address] = now + self._scan_interval * POLL_FACTORS[poll_class]
 
     async def get_value(self, rest_item: RestItem):
         """Read a value from the rest API"""
 
         if rest_item.type in (TYPES.SELECT_NOIF, TYPES.BUTTON):
             return None
-        ro = RestObject(self._rest_api, rest_item)
-        if ro is None:
-            log.warning("RestObject is None for Item %s", rest_item.translation_key)
-            # rest_item.state = None
+        res = await self._rest_api.get_rest(rest_item.address_read)
+        return self.set_value_from_response(rest_item, res)
+
+    def set_value_from_response(self, rest_item: RestItem, res: str):
+        """Decode the value of a rest item from an already fetched response."""
+        if rest_item.type in (TYPES.SELECT_NOIF, TYPES.BUTTON):
+            return None
+        return self._set_state(rest_item, self.get_rest_object(rest_item).decode(res))
+
+    def _set_state(self, rest_item: RestItem, val):
+        """Set a new value of a rest item and remember if it changed."""
+        if val is not None:
+            log.debug("Set Value %s for Item %s", str(val), rest_item.translation_key)
+            if val != rest_item.state:
+                self._changed_items.add(rest_item.translation_key)
+            rest_item.state = val
         else:
-            val = await ro.value
-            if val is not None:
-                log.debug(
-                    "Set Value %s for Item %s", str(val), rest_item.translation_key
-                )
-                rest_item.state = val
-            else:
-                log.warning("None value for Item %s ignored", rest_item.translation_key)
+            log.warning("None value for Item %s ignored", rest_item.translation_key)
         return rest_item.state
 
+    def item_changed(self, rest_item: RestItem) -> bool:
+        """Return True if the value of the item changed in the last cycle."""
+        return rest_item.translation_key in self._changed_items
+
+    def get_rest_object(self, rest_item: RestItem) -> RestObject:
+        """Return the RestObject of a rest item."""
+        ro = self._rest_objects.get(rest_item.translation_key)
+        if ro is None:
+            ro = RestObject(self._rest_api, rest_item)
+            self._rest_objects[rest_item.translation_key] = ro
+        return ro
+
     def get_value_from_item(self, translation_key: str):
         """Read a value from another rest item"""
-        for item in self._restitems:
-            if item.translation_key == translation_key:
-                return item.state
-        return None
+        item = self._items_by_key.get(translation_key)
+        if item is None:
+            return None
+        return item.state
+
+    async def _get_translations(self, language: str) -> dict:
+        """Return the entity translations, loaded once per language."""
+        if self._translations is None or self._translations_language != language:
+            self._translations = await async_get_translations(
+                self.hass, language, "entity", {CONST.DOMAIN}
+            )
+            self._translations_language = language
+        return self._translations
 
     async def _cache_device_info(self):
-        """Cache device info with translations."""
+        """Cache device info with translations.
+
+        The device info is only rebuilt when one of its source values or the
+        language changes.
+        """
+        device_type = self.get_value_from_item("device_type")
+        sw_version = self.get_value_from_item("software_version")
+        serial_number = self.get_value_from_item("device_number")
+        language = self.hass.config.language
+
+        device_info_key = (device_type, sw_version, serial_number, language)
+        if device_info_key == self._device_info_key:
+            return
+        self._device_info_key = device_info_key
+
         model = None
-        for item in self._restitems:
-            if item.translation_key == "device_type" and item.state:
-                translations = await async_get_translations(
-                    self.hass, self.hass.config.language, "entity", {CONST.DOMAIN}
-                )
-                translation_key = f"component.{CONST.DOMAIN}.entity.sensor.device_type.state.{item.state}"
-                model = translations.get(translation_key, item.state)
-                break
+        if device_type:
+            translations = await self._get_translations(language)
+            translation_key = f"component.{CONST.DOMAIN}.entity.sensor.device_type.state.{device_type}"
+            model = translations.get(translation_key, device_type)
 
         self._cached_device_info = {
-            "sw_version": self.get_value_from_item("software_version"),
+            "sw_version": sw_version,
             "model": model,
-            "serial_number": self.get_value_from_item("device_number"),
+            "serial_number": serial_number,
         }
+        self._update_device_registry()
+
+    def _update_device_registry(self):
+        """Update the registered devices with the device info.
+
+        The entities are registered before the device info is read, so the
+        devices are updated once it is known.
+        """
+        changes = {}
+        if self._cached_device_info["sw_version"]:
+            changes["sw_version"] = str(self._cached_device_info["sw_version"])
+        if self._cached_device_info["model"]:
+            changes["model"] = str(self._cached_device_info["model"])
+        if self._cached_device_info["serial_number"]:
+            changes["serial_number"] = str(
+                int(self._cached_device_info["serial_number"])
+            )
+        if not changes:
+            return
+        registry = dr.async_get(self.hass)
+        for device in {item.device for item in self._restitems}:
+            device_entry = registry.async_get_device(
+                identifiers={(CONST.DOMAIN, device)}
+            )
+            if device_entry is not None:
+                registry.async_update_device(device_entry.id, **changes)
 
     def get_device_info_values(self) -> dict:
         """Get cached device info values."""
         return self._cached_device_info
 
-    async def _async_setup(self):
-        """Set up the coordinator.
-
-        This is the place to set up your coordinator,
-        or to load data, that only needs to be loaded once.
+    async def async_load_static_registers(self):
+        """Serve the static registers from the store instead of the device.
 
-        This method will be called automatically during
-        coordinator.async_config_entry_first_refresh.
+        The stored registers are only used if the device type matches the
+        one connect() just read. Device number and software version are read
+        again after REVALIDATE_DELAY, a replaced device or a firmware update
+        causes all static registers to be read again.
         """
-        # await self._rest_api.login()
-        await self._rest_api.connect()
+        entry_id = self._config_entry.entry_id
+        registers = await self._static_store.async_get_registers(entry_id)
+        if not registers:
+            return
+        device_type = self._rest_api.get_devicetype()
+        if device_type is None or registers.get("FF00") != device_type:
+            log.info("Device type changed, stored static registers discarded")
+            self._static_store.clear_unsupported(entry_id)
+            self._static_store.remove_entry(entry_id)
+            return
+        for address in self._static_addresses:
+            res = registers.get(address)
+            if res is None:
+                continue
+            for index in self._address_groups[address]:
+                self.set_value_from_response(self._restitems[index], res)
+            self._raw_responses[address] = res
+            self._next_due[address] = math.inf
+        self._saved_static = registers
+        revalidate_at = time.monotonic() + REVALIDATE_DELAY
+        for address in REVALIDATE_ADDRESSES:
+            if address in registers and address in self._next_due:
+                self._restored_static[address] = registers[address]
+                self._next_due[address] = revalidate_at
         await self._cache_device_info()
 
+    def _revalidate_static(self, address: str, res: str):
+        """Compare a restored register with the response of the device."""
+        restored = self._restored_static.pop(address, None)
+        if restored is None or restored == res:
+            return
+        log.info("Static register %s changed, reading all static registers", address)
+        for static_address in self._static_addresses:
+            if static_address in self._next_due:
+                self._next_due[static_address] = 0.0
+        self._forget_unsupported()
+
+    def _forget_unsupported(self):
+        """Learn the unsupported addresses again, e.g. after a firmware update."""
+        if not self._unsupported:
+            return
+        log.info("Device changed, unsupported addresses are learned again")
+        for address in self._unsupported:
+            if address in self._address_groups:
+                self._next_due[address] = 0.0
+        self._unsupported = set()
+        self._unsupported_saved = True
+        self._rest_api.reset_unsupported_answers()
+        self._static_store.clear_unsupported(self._config_entry.entry_id)
+        if self._excluded_addresses:
+            # the items dropped at setup are only created by a reload, the
+            # stored registers of the former device must not be restored then
+            self._static_store.remove_entry(self._config_entry.entry_id)
+            self.hass.config_entries.async_schedule_reload(
+                self._config_entry.entry_id
+            )
+
+    def _save_static_registers(self):
+        """Store the static registers once all of them were read."""
+        registers = {
+            address: self._raw_responses.get(address)
+            for address in self._static_addresses
+            if address not in self._unsupported
+        }
+        if None in registers.values() or registers == self._saved_static:
+            return
+        self._saved_static = registers
+        self._static_store.save_registers(self._config_entry.entry_id, registers)
+
+    def _update_capabilities(self):
+        """Drop the addresses the device does not implement from the poll plan.
+
+        The learned addresses are stored with the device, the items of these
+        addresses are not created anymore after the next reload.
+        """
+        for address, count in self._rest_api.unsupported_answers.items():
+            if (
+                count < REST.UNSUPPORTED_THRESHOLD
+                or address not in self._next_due
+                or address == REST.PROBE_COMMAND
+            ):
+                continue
+            log.warning(
+                "Address %s not supported by the device, it is not polled anymore",
+                address,
+            )
+            self._unsupported.add(address)
+            del self._next_due[address]
+            self._unsupported_saved = False
+        if not self._unsupported_saved:
+            self._unsupported_saved = self._static_store.save_unsupported(
+                self._config_entry.entry_id, list(self._unsupported)
+            )
+
     async def fetch_data(self, idx=None):
-        """Fetch all values from the REST."""
-        # if idx is not None:
-        if idx is None:
-            # first run: Update all entitiies
-            to_update = tuple(range(len(self._restitems)))
-        elif len(idx) == 0:
-            # idx exists but is not yet filled up: Update all entitiys.
-            to_update = tuple(range(len(self._restitems)))
+        """Fetch all values from the REST that are due in this tick."""
+        now = time.monotonic()
+        self._changed_items = set()
+        self._answered = set()
+        if not await self._rest_api.async_check_health():
+            # device is unreachable, skip the cycle instead of waiting for every item
+            log.debug("Judo Water treatment unreachable, poll skipped")
+            self._apply_interval(self._adaptive.update(False, None), now)
+            self._update_metrics(now)
+            return
+        due = self._due_addresses(now)
+        if idx is None or len(idx) == 0:
+            # first run or idx not yet filled up: Update all entities
+            addresses = {address: self._address_groups[address] for address in due}
         else:
             # idx exists and is filled up: Update only entitys requested by the coordinator.
-            to_update = idx
+            addresses = {}
+            for address in due:
+                requested = [
+                    index for index in self._address_groups[address] if index in idx
+                ]
+                if requested:
+                    addresses[address] = requested
 
         # log.info("Start Scan")
-        for index in to_update:
+        # each address is requested once, all its items are decoded from that response.
+        # the command queue of the rest API limits the requests in flight,
+        # max_parallel_requests = 1 keeps the serial behaviour for weak devices
+        await asyncio.gather(
+            *(
+                self._fetch_address(address, indices)
+                for address, indices in addresses.items()
+            )
+        )
+        self._update_calculations()
+        self._adapt_interval(addresses, now)
+        for address in addresses:
+            self._schedule_address(address, now)
+        self._update_capabilities()
+        self._save_static_registers()
+        self._update_metrics(now)
+
+    def _update_metrics(self, start: float):
+        """Record the cycle duration and show the request metrics."""
+        duration = time.monotonic() - start
+        self._cycle_durations.append(duration)
+        metrics = self._rest_api.request_metrics
+        self._set_coordinator_value("cycle_duration", round(duration, 3))
+        self._set_coordinator_value("request_count", metrics.requests)
+        self._set_coordinator_value("request_errors", metrics.errors)
+        latency = metrics.latency_percentile(95)
+        if latency is not None:
+            self._set_coordinator_value("request_latency", round(latency * 1000))
+        last_success = metrics.last_success
+        if last_success is not None:
+            self._set_coordinator_value(
+                "last_success", str(datetime.fromtimestamp(int(last_success)))
+            )
+
+    def _adapt_interval(self, addresses, now: float):
+        """Adjust the scan interval to the activity and health of the device."""
+        polled = [
+            address for address in addresses if address not in STATISTICS_COMMANDS
+        ]
+        if len(polled) == 0:
+            return
+        reachable = any(address in self._answered for address in polled)
+        active = None
+        activity_item = self._items_by_key.get(ACTIVITY_ITEM)
+        if (
+            activity_item is not None
+            and activity_item.address_read in addresses
+            and activity_item.state is not None
+        ):
+            if self._activity_value is not None:
+                active = activity_item.state != self._activity_value
+            self._activity_value = activity_item.state
+
+        self._apply_interval(self._adaptive.update(reachable, active), now)
+
+    def _apply_interval(self, interval: float, now: float):
+        """Apply a new scan interval to the coordinator and the scheduler."""
+        if interval != self._scan_interval:
+            self._scan_interval = interval
+            self.update_interval = timedelta(seconds=interval * self._tick_factor)
+            # pull addresses scheduled with a longer interval forward
+            for address, next_due in self._next_due.items():
+                poll_class = self._address_poll[address]
+                if poll_class in POLL_FACTORS:
+                    self._next_due[address] = min(
+                        next_due, now + interval * POLL_FACTORS[poll_class]
+                    )
+        self._set_coordinator_value("scan_interval", self._scan_interval)
+
+    def _set_coordinator_value(self, calc: str, val):
+        """Set the state of the items showing a value of the coordinator itself."""
+        for item in self._coordinator_items.get(calc, ()):
+            self._set_state(item, val)
+
+    def _update_calculations(self):
+        """Feed the calculated items with the values read in this cycle."""
+        for item, source, calculator in self._calculations:
+            read_time = self._read_times.get(source.address_read)
+            if read_time is None or source.state is None:
+                continue
+            try:
+                val = calculator.add_sample(read_time, source.state)
+            except Exception:
+                log.warning("calculation failed for %s", item.translation_key)
+                continue
+            if val is None:
+                # too few samples, e.g. after a counter reset: the value is unknown
+                if item.state is not None:
+                    self._changed_items.add(item.translation_key)
+                item.state = None
+                continue
+            self._set_state(item, val)
+
+    async def _fetch_address(self, address: str, indices: list[int]):
+        """Fetch one address and decode all items using it.
+
+        Errors are caught per address and item, so one failing register does
+        not affect the others.
+        """
+        if address in STATISTICS_COMMANDS:
+            await self._fetch_statistics(address, indices)
+            return
+        try:
+            res = await self._rest_api.get_rest(address)
+        except Exception:
+            log.warning("connection to Judo Water treatment failed for %s", address)
+            return
+        if res is not None:
+            # a cached response was read before, e.g. for the flow rate
+            read_time = self._rest_api.response_time(address)
+            self._read_times[address] = (
+                time.monotonic() if read_time is None else read_time
+            )
+            self._answered.add(address)
+            self._raw_responses[address] = res
+            self._revalidate_static(address, res)
+        for index in indices:
             item = self._restitems[index]
             try:
-                await self.get_value(item)
+                self.set_value_from_response(item, res)
             except Exception:
                 log.warning(
-                    "connection to Judo Water treatment failed for %s",
+                    "decoding of Judo Water treatment data failed for %s",
                     item.translation_key,
                 )
 
+    async def _fetch_statistics(self, command: str, indices: list[int]):
+        """Fetch a statistic register and set the period totals of its items.
+
+        The period of an item is given as "offset" in its params, 0 is the
+        current period, 1 the one before.
+        """
+        today = dt_util.now().date()
+        for index in indices:
+            item = self._restitems[index]
+            offset = item.params.get("offset", 0) if item.params is not None else 0
+            try:
+                values = await self._statistics.async_get_values(
+                    command, today, offset
+                )
+                if values is not None:
+                    self._set_state(item, float(sum(values)))
+            except Exception:
+                log.warning(
+                    "reading of Judo Water treatment statistic failed for %s",
+                    item.translation_key,
+                )
+
+    def address_diagnostics(self) -> dict:
+        """Return poll class, last raw response and decoded items per address."""
+        now = time.monotonic()
+        result = {}
+        for address, indices in self._address_groups.items():
+            read_time = self._read_times.get(address)
+            result[address] = {
+                "poll_class": self._address_poll[address],
+                "raw": self._raw_responses.get(address),
+                "age": None if read_time is None else round(now - read_time, 1),
+                "items": {
+                    self._restitems[index].translation_key: self._restitems[index].state
+                    for index in indices
+                },
+            }
+        return result
+
+    @property
+    def rest_items(self) -> list[RestItem]:
+        """Return the items supported by the device."""
+        return self._restitems
+
+    @property
+    def unsupported_addresses(self) -> list[str]:
+        """Return the addresses the device does not implement."""
+        return sorted(self._unsupported)
+
+    @property
+    def cycle_durations(self) -> list[float]:
+        """Return the durations of the last poll cycles in seconds."""
+        return list(self._cycle_durations)
+
+    @property
+    def statistics(self) -> StatisticsEngine:
+        """Return the statistics engine."""
+        return self._statistics
+
     async def _async_update_data(self):
         """Fetch data from API endpoint.
 
@@ -151,6 +656,7 @@ class MyCoordinator(DataUpdateCoordinator):
                 await self._cache_device_info()
         except Exception:
             log.warning("Error fetching Judo Water treatment data")
+        return {key: item.state for key, item in self._items_by_key.items()}
 
     @property
     def rest_api(self):
@@ -0,0 +1,75 @@
+"""Diagnostics support for the Judo REST API."""
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .configentry import MyConfigEntry
+from .statistics import STATISTICS_COMMANDS
+
+# access data, device serial and the service contact with its phone number
+TO_REDACT = {
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    "serial_number",
+    "device_number",
+    "service_contact",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: MyConfigEntry
+) -> dict:
+    """Return diagnostics for a config entry."""
+    rest_api = entry.runtime_data.rest_api
+    coordinator = entry.runtime_data.coordinator
+    request_metrics = rest_api.request_metrics.as_dict()
+
+    addresses = coordinator.address_diagnostics()
+    for address, diagnostics in addresses.items():
+        diagnostics["requests"] = request_metrics.get(address)
+        if TO_REDACT.intersection(diagnostics["items"]):
+            # the raw response holds the redacted value
+            diagnostics["raw"] = REDACTED
+
+    return async_redact_data(
+        {
+            "entry": {
+                "version": entry.version,
+                "data": dict(entry.data),
+            },
+            "device": {
+                "device_type": rest_api.get_devicetype(),
+                **coordinator.get_device_info_values(),
+            },
+            "capabilities": {
+                "items": len(coordinator.rest_items),
+                "unsupported_addresses": coordinator.unsupported_addresses,
+                "unsupported_answers": dict(rest_api.unsupported_answers),
+            },
+            "connection": {
+                "health": rest_api.health,
+                "cache": rest_api.cache_metrics,
+                "queue": rest_api.queue_metrics,
+            },
+            "polling": {
+                "update_interval": coordinator.update_interval.total_seconds(),
+                "cycle_durations": [
+                    round(duration, 3) for duration in coordinator.cycle_durations
+                ],
+            },
+            "addresses": addresses,
+            # requests not belonging to a polled address, e.g. the health probe
+            "other_requests": {
+                address: metrics
+                for address, metrics in request_metrics.items()
+                if address not in addresses
+            },
+            "statistics": {
+                command: coordinator.statistics.get_values(command)
+                for command in STATISTICS_COMMANDS
+            },
+        },
+        TO_REDACT,
+    )
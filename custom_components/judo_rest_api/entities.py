@@ -2,21 +2,23 @@
 
 import logging
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
-from homeassistant.components.number import NumberEntity
+from homeassistant.components.sensor import RestoreSensor, SensorStateClass
+from homeassistant.components.number import RestoreNumber
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.components.button import ButtonEntity
 from homeassistant.components.select import SelectEntity
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .coalescer import WriteCoalescer
 from .configentry import MyConfigEntry
 from .const import CONF, CONST, FORMATS, TYPES
 from .coordinator import MyCoordinator
 from .items import RestItem
-from .restobject import RestAPI, RestObject
+from .restobject import RestAPI
 
 logging.basicConfig()
 log = logging.getLogger(__name__)
@@ -37,6 +39,8 @@ class MyEntity(Entity):
     _attr_should_poll = True
     _attr_has_entity_name = True
     _attr_entity_name = None
+    # raw values are for debugging only and never written to the recorder
+    _unrecorded_attributes = frozenset({"raw_value"})
     _divider = 1
 
     def __init__(
@@ -50,6 +54,11 @@ class MyEntity(Entity):
         self._rest_item = rest_item
         self._coordinator = coordinator
         self._rest_api = self._coordinator.rest_api
+        self._rest_object = self._coordinator.get_rest_object(self._rest_item)
+        self._last_available = None
+        self._debug_attributes = self._config_entry.data.get(
+            CONF.DEBUG_ATTRIBUTES, CONST.DEBUG_ATTRIBUTES
+        )
 
         dev_postfix = "_" + self._config_entry.data[CONF.DEVICE_POSTFIX]
 
@@ -110,6 +119,21 @@ class MyEntity(Entity):
             icon = self._rest_item.params.get("icon", None)
             if icon is not None:
                 self._attr_icon = icon
+            self._attr_entity_registry_enabled_default = self._rest_item.params.get(
+                "enabled_default", True
+            )
+
+    def state_changed(self) -> bool:
+        """Return True if the entity state has to be written after a coordinator update.
+
+        Only items whose value changed in the last cycle and changes of the
+        availability lead to a new state.
+        """
+        available = self.available
+        if available != self._last_available:
+            self._last_available = available
+            return True
+        return self._coordinator.item_changed(self._rest_item)
 
     def my_device_info(self) -> DeviceInfo:
         """Build the device info with dynamic values."""
@@ -122,13 +146,13 @@ class MyEntity(Entity):
         if self._coordinator is not None:
             device_info_values = self._coordinator.get_device_info_values()
 
-            if device_info_values["sw_version"]:
+            if device_info_values.get("sw_version"):
                 sw_version = str(device_info_values["sw_version"])
 
-            if device_info_values["model"]:
+            if device_info_values.get("model"):
                 model = str(device_info_values["model"])
 
-            if device_info_values["serial_number"]:
+            if device_info_values.get("serial_number"):
                 serial_number = str(int(device_info_values["serial_number"]))
 
         return {
@@ -149,23 +173,21 @@ class MyEntity(Entity):
 
     @property
     def extra_state_attributes(self):
-        """Return the state attributes."""
-        attrs = {}
-
-        # Add raw REST API response if available
-        if (
-            hasattr(self, "_rest_item")
-            and self._rest_item
-            and self._rest_item.raw_value is not None
-        ):
-            attrs["raw_value"] = self._rest_item.raw_value
+        """Return the state attributes.
 
-        attrs["address_read"] = self._rest_item.address_read
+        Only static metadata by default. The raw response of the device is
+        added with the debug option, it is available in the diagnostics
+        anyway.
+        """
+        attrs = {"address_read": self._rest_item.address_read}
+
+        if self._debug_attributes and self._rest_item.raw_value is not None:
+            attrs["raw_value"] = self._rest_item.raw_value
 
         return attrs
 
 
-class MySensorEntity(CoordinatorEntity, SensorEntity, MyEntity):
+class MySensorEntity(CoordinatorEntity, RestoreSensor, MyEntity):
     """Class that represents a sensor entity.
 
     Derived from Sensorentity
@@ -183,15 +205,47 @@ class MySensorEntity(CoordinatorEntity, SensorEntity, MyEntity):
         super().__init__(coordinator, context=idx)
         self.idx = idx
         MyEntity.__init__(self, config_entry, rest_item, coordinator)
+        self._attr_native_value = self._rest_item.state
+
+    async def async_added_to_hass(self) -> None:
+        """Show the last known value until the first value is read."""
+        await super().async_added_to_hass()
+        if self._rest_item.state is not None:
+            return
+        last_data = await self.async_get_last_sensor_data()
+        if last_data is not None:
+            self._attr_native_value = last_data.native_value
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.state_changed():
+            return
         self._attr_native_value = self._rest_item.state
         self.async_write_ha_state()
 
 
-class MyNumberEntity(CoordinatorEntity, NumberEntity, MyEntity):  # pylint: disable=W0223
+class MyCalcSensorEntity(MySensorEntity):
+    """Class that represents a calculated sensor entity.
+
+    The value is calculated by the coordinator from other items,
+    no own requests are sent to the device.
+    """
+
+    async def async_added_to_hass(self) -> None:
+        """Do not restore the last value, it is calculated from current values."""
+        await super(MySensorEntity, self).async_added_to_hass()
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        source = self._rest_item.params.get("source")
+        if source is None:
+            return {}
+        return {"source": source}
+
+
+class MyNumberEntity(CoordinatorEntity, RestoreNumber, MyEntity):  # pylint: disable=W0223
     """Represent a Number Entity.
 
     Class that represents a number entity derived from NumberEntity
@@ -209,17 +263,41 @@ class MyNumberEntity(CoordinatorEntity, NumberEntity, MyEntity):  # pylint: disa
         super().__init__(coordinator, context=idx)
         self._idx = idx
         MyEntity.__init__(self, config_entry, rest_item, coordinator)
+        self._attr_native_value = self._rest_item.state
+        debounce = CONST.WRITE_DEBOUNCE
+        if self._rest_item.params is not None:
+            debounce = self._rest_item.params.get("debounce", debounce)
+        self._write_coalescer = WriteCoalescer(self._rest_object.setvalue, debounce)
+
+    async def async_added_to_hass(self) -> None:
+        """Show the last known value until the first value is read."""
+        await super().async_added_to_hass()
+        if self._rest_item.state is not None:
+            return
+        last_data = await self.async_get_last_number_data()
+        if last_data is not None:
+            self._attr_native_value = last_data.native_value
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Send a pending write before the entity is removed."""
+        await self._write_coalescer.async_flush()
+        await super().async_will_remove_from_hass()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.state_changed():
+            return
         self._attr_native_value = self._rest_item.state
         self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
-        """Send value over modbus and refresh HA."""
-        ro = RestObject(self._rest_api, self._rest_item)
-        await ro.setvalue(value)  # rest_item.state will be set inside ro.setvalue
+        """Send value over modbus and refresh HA.
+
+        Values set within the debounce window are coalesced into one write
+        of the last value.
+        """
+        await self._write_coalescer.async_write(value)  # rest_item.state will be set inside ro.setvalue
         #        await self._coordinator.get_value(self._rest_item)
         self._attr_native_value = self._rest_item.state
         self.async_write_ha_state()
@@ -243,24 +321,25 @@ class MySwitchEntity(CoordinatorEntity, SwitchEntity, MyEntity):  # pylint: disa
         super().__init__(coordinator, context=idx)
         self._idx = idx
         MyEntity.__init__(self, config_entry, rest_item, coordinator)
+        self._attr_is_on = self._rest_item.state
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.state_changed():
+            return
         self._attr_is_on = self._rest_item.state
         self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        ro = RestObject(self._rest_api, self._rest_item)
-        await ro.setvalue(1)  # rest_item.state will be set inside ro.setvalue
+        await self._rest_object.setvalue(1)  # rest_item.state will be set inside ro.setvalue
         self._attr_is_on = self._rest_item.state
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        ro = RestObject(self._rest_api, self._rest_item)
-        await ro.setvalue(0)  # rest_item.state will be set inside ro.setvalue
+        await self._rest_object.setvalue(0)  # rest_item.state will be set inside ro.setvalue
         self._attr_is_on = self._rest_item.state
         self.async_write_ha_state()
 
@@ -286,11 +365,10 @@ class MyButtonEntity(CoordinatorEntity, ButtonEntity, MyEntity):  # pylint: disa
 
     async def async_press(self):
         """Turn the entity on."""
-        ro = RestObject(self._rest_api, self._rest_item)
-        await ro.setvalue()  # rest_item.state will be set inside ro.setvalue
+        await self._rest_object.setvalue()  # rest_item.state will be set inside ro.setvalue
 
 
-class MySelectEntity(CoordinatorEntity, SelectEntity, MyEntity):  # pylint: disable=W0223
+class MySelectEntity(CoordinatorEntity, SelectEntity, RestoreEntity, MyEntity):  # pylint: disable=W0223
     """Class that represents a sensor entity.
 
     Class that represents a sensor entity derived from Sensorentity
@@ -317,13 +395,23 @@ class MySelectEntity(CoordinatorEntity, SelectEntity, MyEntity):  # pylint: disa
         if self._rest_item.type == TYPES.SELECT_NOIF:
             self._rest_item.state = self.options[0]
             self._attr_current_option = self._rest_item.state
+        elif self._rest_item.state is not None:
+            self._attr_current_option = self._rest_item.state
         else:
             self._attr_current_option = "FEHLER"
 
+    async def async_added_to_hass(self) -> None:
+        """Show the last known option until the first value is read."""
+        await super().async_added_to_hass()
+        if self._rest_item.state is not None:
+            return
+        last_state = await self.async_get_last_state()
+        if last_state is not None and last_state.state in self.options:
+            self._attr_current_option = last_state.state
+
     async def async_select_option(self, option: str) -> None:
         """Write the selected option to modbus and refresh HA."""
-        ro = RestObject(self._rest_api, self._rest_item)
-        await ro.addvalue(option)  # rest_item.state will be set inside ro.setvalue
+        await self._rest_object.addvalue(option)  # rest_item.state will be set inside ro.setvalue
         if self._rest_item.type == TYPES.SELECT_NOIF:
             self._rest_item.state = self.options[0]
             self._attr_current_option = self._rest_item.state
@@ -335,5 +423,7 @@ class MySelectEntity(CoordinatorEntity, SelectEntity, MyEntity):  # pylint: disa
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.state_changed():
+            return
         self._attr_current_option = self._rest_item.state
         self.async_write_ha_state()
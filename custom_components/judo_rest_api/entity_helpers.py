@@ -5,7 +5,13 @@ from .configentry import MyConfigEntry
 from .items import RestItem
 from .const import TYPES
 from .coordinator import MyCoordinator
-from .entities import MySensorEntity, MyNumberEntity, MyButtonEntity, MySelectEntity
+from .entities import (
+    MySensorEntity,
+    MyCalcSensorEntity,
+    MyNumberEntity,
+    MyButtonEntity,
+    MySelectEntity,
+)
 
 logging.basicConfig()
 log = logging.getLogger(__name__)
@@ -44,15 +50,15 @@ async def build_entity_list(
                     entries.append(
                         MySensorEntity(config_entry, item, coordinator, index)
                     )
-                #                case TYPES.SENSOR_CALC:
-                #                    entries.append(
-                #                        MyCalcSensorEntity(
-                #                            config_entry,
-                #                            item,
-                #                            coordinator,
-                #                            index,
-                #                        )
-                #                    )
+                case TYPES.SENSOR_CALC:
+                    entries.append(
+                        MyCalcSensorEntity(
+                            config_entry,
+                            item,
+                            coordinator,
+                            index,
+                        )
+                    )
                 case TYPES.SELECT | TYPES.SELECT_NOIF:
                     entries.append(
                         MySelectEntity(config_entry, item, coordinator, index)
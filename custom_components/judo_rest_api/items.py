@@ -2,7 +2,8 @@
 
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DeviceConstants, FormatConstants, TypeConstants
+from .codec import ItemCodec
+from .const import POLL, DeviceConstants, FormatConstants, TypeConstants
 
 
 class StatusItem:
@@ -12,6 +13,8 @@ class StatusItem:
     especially when searching backwards. (At least I don't know how...)
     """
 
+    __slots__ = ("_number", "_translation_key")
+
     def __init__(
         self,
         number: int,
@@ -48,6 +51,27 @@ class RestItem:
     This can either be a RestItem or a WebifItem
     """
 
+    __slots__ = (
+        "_translation_key",
+        "_address_read",
+        "_read_index",
+        "_read_bytes",
+        "_address_write",
+        "_write_index",
+        "_write_bytes",
+        "_format",
+        "_type",
+        "_device",
+        "_entity_category",
+        "_resultlist",
+        "_number_to_key",
+        "_key_to_number",
+        "_params",
+        "_state",
+        "_raw_value",
+        "_codec",
+    )
+
     def __init__(
         self,
         translation_key: str,
@@ -77,9 +101,17 @@ class RestItem:
         self._device = device
         self._entity_category = entity_category
         self._resultlist = resultlist
+        # index the status list once, the first entry wins like in a linear search
+        self._number_to_key: dict[int, str] = {}
+        self._key_to_number: dict[str, int] = {}
+        if resultlist is not None:
+            for item in resultlist:
+                self._number_to_key.setdefault(item.number, item.translation_key)
+                self._key_to_number.setdefault(item.translation_key, item.number)
         self._params = params
         self._state = None
         self._raw_value = None
+        self._codec = None
 
     @property
     def params(self) -> dict:
@@ -89,6 +121,21 @@ class RestItem:
     @params.setter
     def params(self, val: dict):
         self._params = val
+        self._codec = None
+
+    @property
+    def codec(self) -> ItemCodec:
+        """Return the decoder/encoder of the item, compiled on first use."""
+        if self._codec is None:
+            self._codec = ItemCodec(self)
+        return self._codec
+
+    @property
+    def poll_class(self) -> str:
+        """Return the poll class of the item, declared as "poll" in its params."""
+        if self._params is None:
+            return POLL.NORMAL
+        return self._params.get("poll", POLL.NORMAL)
 
     @property
     def state(self):
@@ -156,10 +203,10 @@ class RestItem:
             return None
         if self._resultlist is None:
             return None
-        for _useless, item in enumerate(self._resultlist):
-            if val == item.number:
-                return item.translation_key
-        return "unbekannt <" + str(val) + ">"
+        key = self._number_to_key.get(val)
+        if key is None:
+            return "unbekannt <" + str(val) + ">"
+        return key
 
     def get_number_from_translation_key(self, val: str) -> int:
         """Get number of coresponding errortext."""
@@ -167,10 +214,7 @@ class RestItem:
             return None
         if self._resultlist is None:
             return None
-        for _useless, item in enumerate(self._resultlist):
-            if val == item.translation_key:
-                return item.number
-        return -1
+        return self._key_to_number.get(val, -1)
 
     @property
     def address_read(self) -> int:
@@ -191,6 +235,7 @@ class RestItem:
     def read_index(self, val: int):
         """Set address."""
         self._read_index = val
+        self._codec = None
 
     @property
     def read_bytes(self) -> int:
@@ -201,6 +246,7 @@ class RestItem:
     def read_bytes(self, val: int):
         """Set address."""
         self._read_bytes = val
+        self._codec = None
 
     @property
     def address_write(self) -> int:
@@ -231,3 +277,4 @@ class RestItem:
     def write_bytes(self, val: int):
         """Set address."""
         self._write_bytes = val
+        self._codec = None
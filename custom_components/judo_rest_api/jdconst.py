@@ -10,7 +10,7 @@ from homeassistant.const import (
 from homeassistant.helpers.entity import EntityCategory
 
 
-from .const import DEVICES, FORMATS, TYPES
+from .const import DEVICES, FORMATS, POLL, TYPES
 from .items import RestItem, StatusItem
 
 reverse_device_list: dict[str, str] = {
@@ -139,7 +139,13 @@ PARAMS_MINUTES: dict = {
     "preciosion": 0,
     "unit": UnitOfTime.MINUTES,
     "stateclass": SensorStateClass.MEASUREMENT,
-    "icon": "mdi:timelapse"
+    "icon": "mdi:timelapse",
+    "poll": POLL.SLOW,
+}
+
+PARAMS_DAYS_SLOW: dict = {
+    **PARAMS_DAYS,
+    "poll": POLL.SLOW,
 }
 
 PARAMS_HOURS: dict = {
@@ -147,7 +153,8 @@ PARAMS_HOURS: dict = {
     "preciosion": 0,
     "unit": UnitOfTime.HOURS,
     "stateclass": SensorStateClass.MEASUREMENT,
-    "icon": "mdi:timelapse"
+    "icon": "mdi:timelapse",
+    "poll": POLL.SLOW,
 }
 
 PARAMS_GDH: dict = {
@@ -158,7 +165,8 @@ PARAMS_GDH: dict = {
     "unit": "°dH",
     "divider": 1,
     "stateclass": SensorStateClass.MEASUREMENT,
-    "icon": "mdi:water-opacity"
+    "icon": "mdi:water-opacity",
+    "poll": POLL.SLOW,
 }
 
 PARAMS_QBM_H: dict = {
@@ -170,7 +178,8 @@ PARAMS_QBM_H: dict = {
     "unit": UnitOfVolume.CUBIC_METERS,
     "stateclass": SensorStateClass.TOTAL_INCREASING,
     "deviceclass": SensorDeviceClass.WATER,
-    "icon": "mdi:water"
+    "icon": "mdi:water",
+    "poll": POLL.FAST,
 }
 
 PARAMS_QBM_W: dict = {
@@ -187,7 +196,8 @@ PARAMS_QBM_W: dict = {
 
 
 PARAMS_CONTACT: dict = {
-    "icon": "mdi:phone"
+    "icon": "mdi:phone",
+    "poll": POLL.STATIC,
 }
 
 PARAMS_CLOSE: dict = {
@@ -202,7 +212,8 @@ PARAMS_REG: dict = {
 }
 
 PARAMS_INFO: dict = {
-    "icon": "mdi:information-box-outline"
+    "icon": "mdi:information-box-outline",
+    "poll": POLL.STATIC,
 }
 
 PARAMS_MASS_REFILL: dict = {
@@ -215,6 +226,96 @@ PARAMS_MASS_REFILL: dict = {
     "unit": UnitOfMass.KILOGRAMS,
     "stateclass": SensorStateClass.MEASUREMENT
 }
+PARAMS_FLOWRATE_CALC: dict = {
+    "precision": 1,
+    "unit": UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+    "stateclass": SensorStateClass.MEASUREMENT,
+    "deviceclass": SensorDeviceClass.VOLUME_FLOW_RATE,
+    "icon": "mdi:water-sync",
+    "calc": "flow_rate",
+    "source": "water_total",
+}
+
+PARAMS_SCAN_INTERVAL: dict = {
+    "precision": 0,
+    "unit": UnitOfTime.SECONDS,
+    "stateclass": SensorStateClass.MEASUREMENT,
+    "deviceclass": SensorDeviceClass.DURATION,
+    "icon": "mdi:timer-sync-outline",
+    "calc": "scan_interval",
+}
+
+PARAMS_CYCLE_DURATION: dict = {
+    "precision": 2,
+    "unit": UnitOfTime.SECONDS,
+    "stateclass": SensorStateClass.MEASUREMENT,
+    "deviceclass": SensorDeviceClass.DURATION,
+    "icon": "mdi:timer-outline",
+    "calc": "cycle_duration",
+    "enabled_default": False,
+}
+
+PARAMS_REQUEST_COUNT: dict = {
+    "precision": 0,
+    "unit": None,
+    "stateclass": SensorStateClass.TOTAL_INCREASING,
+    "icon": "mdi:swap-horizontal",
+    "calc": "request_count",
+    "enabled_default": False,
+}
+
+PARAMS_REQUEST_ERRORS: dict = {
+    "precision": 0,
+    "unit": None,
+    "stateclass": SensorStateClass.TOTAL_INCREASING,
+    "icon": "mdi:alert-circle-outline",
+    "calc": "request_errors",
+    "enabled_default": False,
+}
+
+PARAMS_REQUEST_LATENCY: dict = {
+    "precision": 0,
+    "unit": UnitOfTime.MILLISECONDS,
+    "stateclass": SensorStateClass.MEASUREMENT,
+    "deviceclass": SensorDeviceClass.DURATION,
+    "icon": "mdi:timer-sand",
+    "calc": "request_latency",
+    "enabled_default": False,
+}
+
+PARAMS_LAST_SUCCESS: dict = {
+    "icon": "mdi:clock-check-outline",
+    "calc": "last_success",
+    "enabled_default": False,
+}
+
+PARAMS_STATISTICS: dict = {
+    "precision": 0,
+    "unit": UnitOfVolume.LITERS,
+    "stateclass": SensorStateClass.TOTAL_INCREASING,
+    "deviceclass": SensorDeviceClass.WATER,
+    "icon": "mdi:chart-bar",
+}
+
+PARAMS_STATISTICS_DAY: dict = {
+    **PARAMS_STATISTICS,
+    "offset": 0,
+}
+
+PARAMS_STATISTICS_CURRENT: dict = {
+    **PARAMS_STATISTICS,
+    "offset": 0,
+    "poll": POLL.SLOW,
+}
+
+# past periods do not increase anymore, so they are not recorded as total
+PARAMS_STATISTICS_PAST: dict = {
+    **PARAMS_STATISTICS,
+    "offset": 1,
+    "stateclass": None,
+    "poll": POLL.SLOW,
+}
+
 # pylint: disable=line-too-long
 
 # fmt: off
@@ -224,19 +325,26 @@ REST_SYS_ITEMS: list[RestItem] = [
     RestItem( address_read="0100", read_bytes = 3, read_index=0, mformat=FORMATS.SW_VERSION, mtype=TYPES.SENSOR, device=DEVICES.SYS, params=PARAMS_INFO, translation_key="software_version", entity_category=EntityCategory.DIAGNOSTIC),
 
     RestItem( address_read="5100", read_bytes = 2, read_index=0, address_write="3000", write_bytes = 1, write_index=0, mformat=FORMATS.NUMBER, mtype=TYPES.NUMBER, device=DEVICES.SYS, params=PARAMS_GDH,translation_key="water_hardeness"),
-    RestItem( address_read="5700", read_bytes = 1, read_index=0, address_write="5700", write_bytes = 1, write_index=0, mformat=FORMATS.NUMBER, mtype=TYPES.NUMBER, device=DEVICES.SYS, params=PARAMS_DAYS,translation_key="salt_warning", entity_category=EntityCategory.CONFIG),
+    RestItem( address_read="5700", read_bytes = 1, read_index=0, address_write="5700", write_bytes = 1, write_index=0, mformat=FORMATS.NUMBER, mtype=TYPES.NUMBER, device=DEVICES.SYS, params=PARAMS_DAYS_SLOW,translation_key="salt_warning", entity_category=EntityCategory.CONFIG),
 
 #   RestItem( address_read="5600", read_bytes = 2, read_index=0, mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR, device=DEVICES.SYS, params= PARAMS_MASS, translation_key="salt_storage_mass"),
     RestItem( address_read="5600", read_bytes = 2, read_index=0, address_write="5600", write_bytes = 2, write_index=0, mformat=FORMATS.NUMBER, mtype=TYPES.NUMBER, device=DEVICES.SYS, params=PARAMS_MASS_REFILL, translation_key="salt_storage_mass", entity_category=EntityCategory.CONFIG),
     RestItem( address_read="5600", read_bytes = 2, read_index=2, mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR, device=DEVICES.SYS, params=PARAMS_DAYS, translation_key="salt_storage_days"),
 
     RestItem( address_read="2800", read_bytes = 4, read_index=0, mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR, device=DEVICES.SYS, params=PARAMS_QBM_H, translation_key="water_total"),
+    RestItem( mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR_CALC, device=DEVICES.SYS, params=PARAMS_FLOWRATE_CALC, translation_key="water_flow_rate"),
+    RestItem( mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR_CALC, device=DEVICES.SYS, params=PARAMS_SCAN_INTERVAL, translation_key="effective_scan_interval", entity_category=EntityCategory.DIAGNOSTIC),
+    RestItem( mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR_CALC, device=DEVICES.SYS, params=PARAMS_CYCLE_DURATION, translation_key="cycle_duration", entity_category=EntityCategory.DIAGNOSTIC),
+    RestItem( mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR_CALC, device=DEVICES.SYS, params=PARAMS_REQUEST_COUNT, translation_key="request_count", entity_category=EntityCategory.DIAGNOSTIC),
+    RestItem( mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR_CALC, device=DEVICES.SYS, params=PARAMS_REQUEST_ERRORS, translation_key="request_errors", entity_category=EntityCategory.DIAGNOSTIC),
+    RestItem( mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR_CALC, device=DEVICES.SYS, params=PARAMS_REQUEST_LATENCY, translation_key="request_latency", entity_category=EntityCategory.DIAGNOSTIC),
+    RestItem( mformat=FORMATS.TIMESTAMP, mtype=TYPES.SENSOR_CALC, device=DEVICES.SYS, params=PARAMS_LAST_SUCCESS, translation_key="last_success", entity_category=EntityCategory.DIAGNOSTIC),
     RestItem( address_read="2900", read_bytes = 4, read_index=0, mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR, device=DEVICES.SYS, params=PARAMS_QBM_W, translation_key="water_treated"),
 
     RestItem( address_read="5800", read_bytes = 16, read_index=0, mformat=FORMATS.TEXT, mtype=TYPES.SENSOR, device=DEVICES.SYS, params=PARAMS_CONTACT, translation_key="service_contact", entity_category=EntityCategory.DIAGNOSTIC),
     RestItem( address_read="2500", read_bytes = 1, read_index=0, mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR, device=DEVICES.SYS, params=PARAMS_MINUTES, translation_key="operating_minutes", entity_category=EntityCategory.DIAGNOSTIC),
     RestItem( address_read="2500", read_bytes = 1, read_index=1, mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR, device=DEVICES.SYS, params=PARAMS_HOURS, translation_key="operating_hours", entity_category=EntityCategory.DIAGNOSTIC),
-    RestItem( address_read="2500", read_bytes = 2, read_index=2, mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR, device=DEVICES.SYS, params=PARAMS_DAYS, translation_key="operating_days", entity_category=EntityCategory.DIAGNOSTIC),
+    RestItem( address_read="2500", read_bytes = 2, read_index=2, mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR, device=DEVICES.SYS, params=PARAMS_DAYS_SLOW, translation_key="operating_days", entity_category=EntityCategory.DIAGNOSTIC),
     RestItem( address_read="0E00", read_bytes = 4, read_index=0, mformat=FORMATS.TIMESTAMP, mtype=TYPES.SENSOR, device=DEVICES.SYS,params=PARAMS_INFO, translation_key="install_date", entity_category=EntityCategory.DIAGNOSTIC),
 
     RestItem(address_write="3C00", write_bytes = 0, write_index=0, mformat=FORMATS.BUTTON, mtype=TYPES.BUTTON, device=DEVICES.SYS, params=PARAMS_CLOSE, translation_key="leakage_protection_close"),
@@ -246,13 +354,31 @@ REST_SYS_ITEMS: list[RestItem] = [
 #    RestItem(address_read="5600", read_bytes = 2, read_index=0,address_write="5600", write_bytes = 2, write_index=0, mformat=FORMATS.STATUS, mtype=TYPES.SELECT_NOIF, device=DEVICES.SYS, params= PARAMS_MASS_REFILL, resultlist=SALT_MASS, translation_key="salt_refill_mass"),
 ]
 
-#REST_ST_ITEMS: list[RestItem] = [
-    #RestItem( address_read="FB00", mformat=FORMATS.NUMBER, mtype=TYPES.SENSOR, device=DEVICES.ST, params=PARAMS_QBM_H, translation_key="day_statistics"),
-#]
+REST_ST_ITEMS: list[RestItem] = [
+    RestItem( address_read="FB00", mformat=FORMATS.STATISTICS, mtype=TYPES.SENSOR, device=DEVICES.ST, params=PARAMS_STATISTICS_DAY, translation_key="day_statistics"),
+    RestItem( address_read="FC00", mformat=FORMATS.STATISTICS, mtype=TYPES.SENSOR, device=DEVICES.ST, params=PARAMS_STATISTICS_CURRENT, translation_key="week_statistics"),
+    RestItem( address_read="FD00", mformat=FORMATS.STATISTICS, mtype=TYPES.SENSOR, device=DEVICES.ST, params=PARAMS_STATISTICS_CURRENT, translation_key="month_statistics"),
+    RestItem( address_read="FE00", mformat=FORMATS.STATISTICS, mtype=TYPES.SENSOR, device=DEVICES.ST, params=PARAMS_STATISTICS_CURRENT, translation_key="year_statistics"),
+    RestItem( address_read="FB00", mformat=FORMATS.STATISTICS, mtype=TYPES.SENSOR, device=DEVICES.ST, params=PARAMS_STATISTICS_PAST, translation_key="last_day_statistics"),
+    RestItem( address_read="FC00", mformat=FORMATS.STATISTICS, mtype=TYPES.SENSOR, device=DEVICES.ST, params=PARAMS_STATISTICS_PAST, translation_key="last_week_statistics"),
+    RestItem( address_read="FD00", mformat=FORMATS.STATISTICS, mtype=TYPES.SENSOR, device=DEVICES.ST, params=PARAMS_STATISTICS_PAST, translation_key="last_month_statistics"),
+    RestItem( address_read="FE00", mformat=FORMATS.STATISTICS, mtype=TYPES.SENSOR, device=DEVICES.ST, params=PARAMS_STATISTICS_PAST, translation_key="last_year_statistics"),
+]
 
 DEVICELISTS: list = [
     REST_SYS_ITEMS,
-    #REST_ST_ITEMS,
+    REST_ST_ITEMS,
 ]
 
+# register maps per device type: the addresses a device type does not
+# implement. Device types not listed here use all registers.
+SOFTENER_ADDRESSES: tuple = ("5100", "3000", "5600", "5700", "350000")
+MODEL_UNSUPPORTED_ADDRESSES: dict[str, tuple] = {
+    "3C": SOFTENER_ADDRESSES,  # i-fill
+    "3D": SOFTENER_ADDRESSES,  # i-dos eco
+    "41": SOFTENER_ADDRESSES,  # i-dos eco
+    "44": (*SOFTENER_ADDRESSES, "2900"),  # ZEWA/PROM i-SAFE
+    "68": (*SOFTENER_ADDRESSES, "2900"),  # ZEWA/PROM i-SAFE
+}
+
 # fmt: on
@@ -0,0 +1,149 @@
+"""Request metrics.
+
+Counts the requests of the RestAPI per address: number of requests, errors
+by status, a latency histogram, the last latencies and the time of the last
+successful request. Errors without an HTTP status are counted as "timeout",
+"connection" or "invalid" (unreadable response).
+"""
+
+import logging
+import time
+from collections import Counter, deque
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+# upper bounds of the latency histogram buckets in seconds, plus one overflow bucket
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# number of recent latencies kept per address
+RECENT_SIZE = 10
+
+
+class AddressMetrics:
+    """AddressMetrics.
+
+    The counters of one address.
+    """
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "buckets",
+        "recent",
+        "max_latency",
+        "last_success",
+    )
+
+    def __init__(self) -> None:
+        """Construct AddressMetrics."""
+        self.requests = 0
+        self.errors: Counter = Counter()
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.recent: deque[float] = deque(maxlen=RECENT_SIZE)
+        self.max_latency = 0.0
+        self.last_success: float | None = None
+
+    def as_dict(self) -> dict:
+        """Return the counters as dict."""
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "latency_buckets": dict(
+                zip([*map(str, LATENCY_BUCKETS), "inf"], self.buckets, strict=True)
+            ),
+            "recent_latencies": [round(latency, 3) for latency in self.recent],
+            "max_latency": round(self.max_latency, 3),
+            "last_success": self.last_success,
+        }
+
+
+class RequestMetrics:
+    """RequestMetrics.
+
+    The counters of all addresses of one RestAPI.
+    """
+
+    def __init__(self) -> None:
+        """Construct RequestMetrics."""
+        self._addresses: dict[str, AddressMetrics] = {}
+
+    def record(self, address: str, latency: float, status):
+        """Record a request.
+
+        :param address: address of the request, without the appended payload
+        :param latency: seconds until the response was read or the request failed
+        :param status: HTTP status, or "timeout", "connection", "invalid"
+        """
+        metrics = self._addresses.get(address)
+        if metrics is None:
+            metrics = self._addresses[address] = AddressMetrics()
+        metrics.requests += 1
+        metrics.recent.append(latency)
+        metrics.max_latency = max(metrics.max_latency, latency)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                metrics.buckets[index] += 1
+                break
+        else:
+            metrics.buckets[-1] += 1
+        if status == 200:
+            metrics.last_success = time.time()
+        else:
+            metrics.errors[str(status)] += 1
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests of all addresses."""
+        return sum(metrics.requests for metrics in self._addresses.values())
+
+    @property
+    def errors(self) -> int:
+        """Return the number of failed requests of all addresses."""
+        return sum(
+            sum(metrics.errors.values()) for metrics in self._addresses.values()
+        )
+
+    @property
+    def last_success(self) -> float | None:
+        """Return the epoch time of the last successful request, None if none."""
+        return max(
+            (
+                metrics.last_success
+                for metrics in self._addresses.values()
+                if metrics.last_success is not None
+            ),
+            default=None,
+        )
+
+    def latency_percentile(self, pct: float, address: str | None = None):
+        """Return the latency percentile in seconds from the histogram.
+
+        The upper bound of the bucket is returned, the highest latency seen
+        for the overflow bucket. None if no request was recorded.
+
+        :param pct: percentile, 0 to 100
+        :param address: one address, all addresses if omitted
+        """
+        if address is not None:
+            selected = [self._addresses[address]] if address in self._addresses else []
+        else:
+            selected = list(self._addresses.values())
+        buckets = [sum(values) for values in zip(*(m.buckets for m in selected))]
+        total = sum(buckets)
+        if total == 0:
+            return None
+        rank = pct / 100 * total
+        count = 0
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            count += buckets[index]
+            if count >= rank:
+                return bound
+        return max(metrics.max_latency for metrics in selected)
+
+    def as_dict(self) -> dict:
+        """Return the counters of all addresses."""
+        return {
+            address: metrics.as_dict()
+            for address, metrics in sorted(self._addresses.items())
+        }
@@ -4,15 +4,19 @@ A REST object that contains a REST item and communicates with the REST-API.
 It contains a REST Client for setting and getting REST response values
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import time
 from functools import partial
-import requests
+
+import aiohttp
 from homeassistant.core import HomeAssistant
 
+from .commandqueue import CommandQueue
 from .configentry import MyConfigEntry
-from .const import DEVICETYPES, FORMATS, CONF, TYPES
+from .const import DEVICETYPES, FORMATS, CONF, CONST, HEALTH, LANE, REST, TYPES
 from .items import RestItem
+from .metrics import RequestMetrics
 
 logging.basicConfig()
 log = logging.getLogger(__name__)
@@ -34,6 +38,11 @@ class RestAPI:
         self._port = config_entry.data[CONF.PORT]
         self._username = config_entry.data[CONF.USERNAME]
         self._password = config_entry.data[CONF.PASSWORD]
+        self._max_parallel_requests = int(
+            config_entry.data.get(
+                CONF.MAX_PARALLEL_REQUESTS, CONST.MAX_PARALLEL_REQUESTS
+            )
+        )
         self._hass = hass
         self._rest_client = None
         self._base_url = (
@@ -48,83 +57,278 @@ class RestAPI:
         )
         self._api_url = self._base_url + "/api/rest/"
         self._devicetype = None
-        self._session = None
+        self._session: aiohttp.ClientSession | None = None
+        # set by close, the session is not created again afterwards
+        self._closed = False
         self._connected = False
+        # read-through cache of the responses per address
+        self._cache_ttl = float(
+            config_entry.data.get(CONF.CACHE_TTL, CONST.CACHE_TTL)
+        )
+        self._cache: dict[str, tuple[float, str]] = {}
+        # requests in flight per address, shared by concurrent readers
+        self._inflight: dict[str, asyncio.Task] = {}
+        # incremented by every write, responses of older reads are not cached
+        self._generation: dict[str, int] = {}
+        self._cache_stats = {"hits": 0, "misses": 0, "coalesced": 0}
+        # all requests to the device pass this queue, writes before reads
+        self._queue = CommandQueue(workers=self._max_parallel_requests)
+        # circuit breaker: opens after consecutive failures, closes after a probe
+        self._health = HEALTH.HEALTHY
+        self._failures = 0
+        # requests, errors and latencies per address
+        self._metrics = RequestMetrics()
+        # consecutive answers per address showing it is not implemented
+        self._unsupported_answers: dict[str, int] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive session of this config entry, create it if needed."""
+        if self._closed:
+            raise RuntimeError("Connection to Judo Water Treatment is closed")
+        if self._session is None or self._session.closed:
+            # the command queue limits the requests in flight, not the connector
+            connector = aiohttp.TCPConnector(
+                keepalive_timeout=REST.KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                auth=aiohttp.BasicAuth(self._username, self._password),
+            )
+        return self._session
 
     async def login(self) -> None:
         """Log into the portal. Create cookie to stay logged in for the session."""
+        if self._closed:
+            return
+        async with self._get_session().get(
+            self._base_url,
+            timeout=aiohttp.ClientTimeout(total=REST.READ_TIMEOUT),
+        ) as response:
+            await response.read()
 
-        _useless = await self._hass.async_add_executor_job(
-            partial(
-                requests.get,
-                url=self._base_url,
-                auth=(self._username, self._password),
-                timeout=10,
-            )
-        )
+    async def get_rest(self, command: str, max_age: float | None = None):
+        """get raw response from REST api
 
-        # r = requests.get(self._base_url, auth=(self._username, self._password), timeout=10 )
-        # log.warning(r.text)
+        A response younger than max_age (default: the cache TTL) is served
+        from the cache, concurrent requests of one address share one request.
+        """
+        if command is None or self._closed:
+            return None
+        if max_age is None:
+            max_age = self._cache_ttl
+        cached = self._cache.get(command)
+        if cached is not None and time.monotonic() - cached[0] <= max_age:
+            self._cache_stats["hits"] += 1
+            return cached[1]
+        if self._health == HEALTH.OPEN:
+            # device is unreachable, only async_check_health sends a probe
+            return None
 
-    async def get_rest(self, command: str):
-        """get raw response from REST api"""
-        if command is None:
+        task = self._inflight.get(command)
+        if task is None:
+            self._cache_stats["misses"] += 1
+            task = asyncio.get_running_loop().create_task(self._fetch(command))
+            self._inflight[command] = task
+        else:
+            self._cache_stats["coalesced"] += 1
+        # a cancelled caller must not cancel the request of the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, command: str):
+        """Send a read through the command queue and cache its response."""
+        generation = self._generation.get(command, 0)
+        try:
+            res = await self._queue.async_submit(
+                partial(self._get_rest, command), LANE.NORMAL, REST.READ_DEADLINE
+            )
+        finally:
+            if self._inflight.get(command) is asyncio.current_task():
+                del self._inflight[command]
+        if res is not None and self._generation.get(command, 0) == generation:
+            now = time.monotonic()
+            # drop the expired responses, e.g. of statistic commands with a
+            # date appended, which are not requested again
+            self._cache = {
+                key: value
+                for key, value in self._cache.items()
+                if now - value[0] <= self._cache_ttl
+            }
+            self._cache[command] = (now, res)
+        return res
+
+    def response_time(self, command: str) -> float | None:
+        """Return the monotonic time the cached response of a command was read."""
+        cached = self._cache.get(command)
+        if cached is None:
             return None
+        return cached[0]
 
-        response = None
+    def invalidate(self, command: str | None):
+        """Drop the cached response of an address, e.g. after a write."""
+        if command is None:
+            return
+        self._cache.pop(command, None)
+        self._generation[command] = self._generation.get(command, 0) + 1
+        # later readers must not join a read started before the write
+        self._inflight.pop(command, None)
+
+    @property
+    def cache_metrics(self) -> dict:
+        """Return hits, misses and coalesced requests of the response cache."""
+        return {
+            **self._cache_stats,
+            "entries": len(self._cache),
+            "ttl": self._cache_ttl,
+        }
+
+    async def _get_rest(self, command: str):
+        """get raw response from REST api, regardless of the health state"""
+        status = "unknown status"
+        start = time.monotonic()
         try:
             log.debug("Send command %s", command)
             url = self._api_url + command
-            response = await self._hass.async_add_executor_job(
-                partial(
-                    requests.get,
-                    url=url,
-                    auth=(self._username, self._password),
-                    timeout=10,
-                )
-            )
-            log.debug("Response %s", response.status_code)
-            status = response.status_code
-            if status == 200:
-                res = await self._hass.async_add_executor_job(response.json)
-                log.debug("Content %s", str(res["data"]))
-                return res["data"]
-            else:
+            async with self._get_session().get(
+                url, timeout=aiohttp.ClientTimeout(total=REST.READ_TIMEOUT)
+            ) as response:
+                status = response.status
+                # any answer shows that the device is reachable
+                self._record_success()
+                log.debug("Response %s", status)
+                if status == 200:
+                    # the device does not always send a json content type
+                    res = await response.json(content_type=None)
+                    data = res["data"]
+                    log.debug("Content %s", str(data))
+                    self._metrics.record(command[:4], time.monotonic() - start, 200)
+                    self._record_answer(command[:4], supported=bool(data))
+                    return data
                 log.warning("Content ignored for API return status %s", str(status))
+                self._metrics.record(command[:4], time.monotonic() - start, status)
+                if status in REST.UNSUPPORTED_STATUSES:
+                    self._record_answer(command[:4], supported=False)
                 return None
-        except Exception:
-            if response is not None:
-                status = str(response.status_code)
+        except Exception as exc:
+            if status == "unknown status":
+                self._record_failure()
+                error = "timeout" if isinstance(exc, TimeoutError) else "connection"
             else:
-                status = "unknown status"
-            log.warning("Judo REST API call failed with %s", status)
+                error = "invalid"
+            self._metrics.record(command[:4], time.monotonic() - start, error)
+            log.warning("Judo REST API call failed with %s", str(status))
             return None
 
-    async def set_rest(self, command: str, towrite: str):
-        """write raw response to REST api"""
-        if command is None:
+    def _record_answer(self, address: str, supported: bool):
+        """Count the answers showing that the device does not implement an address."""
+        if supported:
+            self._unsupported_answers.pop(address, None)
+        else:
+            self._unsupported_answers[address] = (
+                self._unsupported_answers.get(address, 0) + 1
+            )
+
+    @property
+    def unsupported_answers(self) -> dict[str, int]:
+        """Return the consecutive unsupported answers per address."""
+        return self._unsupported_answers
+
+    def reset_unsupported_answers(self):
+        """Forget the unsupported answers, e.g. after the device changed."""
+        self._unsupported_answers.clear()
+
+    def _record_success(self):
+        """Reset the circuit breaker after a request was answered."""
+        if self._health != HEALTH.HEALTHY:
+            log.info("Judo Water Treatment is reachable again")
+        self._failures = 0
+        self._health = HEALTH.HEALTHY
+
+    def _record_failure(self):
+        """Count a failed request and open the circuit breaker after too many."""
+        self._failures += 1
+        if self._failures >= REST.FAILURE_THRESHOLD:
+            if self._health != HEALTH.OPEN:
+                log.warning(
+                    "Judo Water Treatment unreachable after %s failed requests",
+                    str(self._failures),
+                )
+            self._health = HEALTH.OPEN
+        else:
+            self._health = HEALTH.DEGRADED
+
+    async def async_check_health(self) -> bool:
+        """Return True if requests shall be sent to the device.
+
+        While the circuit breaker is open, one cheap probe is sent instead of
+        a full poll. Polling resumes once the probe is answered.
+        """
+        if self._health != HEALTH.OPEN:
+            return True
+        await self._queue.async_submit(
+            partial(self._get_rest, REST.PROBE_COMMAND),
+            LANE.NORMAL,
+            REST.READ_DEADLINE,
+        )
+        return self._health != HEALTH.OPEN
+
+    @property
+    def request_metrics(self) -> RequestMetrics:
+        """Return the request counters per address."""
+        return self._metrics
+
+    @property
+    def queue_metrics(self) -> dict:
+        """Return depth and wait times of the command queue."""
+        return self._queue.metrics
+
+    @property
+    def health(self) -> str:
+        """Return the health state of the connection."""
+        return self._health
+
+    async def set_rest(self, command: str, towrite: str, read_command: str | None = None):
+        """write raw response to REST api
+
+        The cached responses of the written address and of read_command,
+        the address the written value is read from, are invalidated.
+        """
+        if command is None or self._closed:
             return None
         if towrite is None:
             return None
+        try:
+            return await self._queue.async_submit(
+                partial(self._set_rest, command, towrite),
+                LANE.HIGH,
+                REST.WRITE_DEADLINE,
+            )
+        finally:
+            self.invalidate(command)
+            self.invalidate(read_command)
 
+    async def _set_rest(self, command: str, towrite: str):
+        """write raw response to REST api, sent by the command queue"""
+        response = None
         try:
             url = self._api_url + command + towrite
-            response = await self._hass.async_add_executor_job(
-                partial(
-                    requests.get,
-                    url=url,
-                    auth=(self._username, self._password),
-                    timeout=2,
-                )
-            )
-            res = await self._hass.async_add_executor_job(response.json)
-            return res["data"]
+            async with self._get_session().get(
+                url, timeout=aiohttp.ClientTimeout(total=REST.WRITE_TIMEOUT)
+            ) as response:
+                self._record_success()
+                res = await response.json(content_type=None)
+                return res["data"]
         except Exception:
+            if response is None:
+                self._record_failure()
             log.warning("Connection to Judo Water Treatment failed")
             return None
 
     async def connect(self):
-        """Open REST connection to test if available."""
+        """Open REST connection to test if available.
+
+        Returns True for a known device type, False for an unknown one and
+        None if the device did not answer.
+        """
         res = await self.get_rest("FF00")
         if res is None:
             return None
@@ -134,13 +338,23 @@ class RestAPI:
             return True
 
         log.warning("Unknown Device detected, ID=%s", res)
-        return None
+        return False
 
-    def close(self):
+    async def close(self):
         """Close REST connection."""
+        self._closed = True
+        await self._queue.async_stop()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
         log.info("Connection to judo closed")
         return True
 
+    @property
+    def max_parallel_requests(self) -> int:
+        """Return the maximum number of requests in flight to the device."""
+        return self._max_parallel_requests
+
     def get_devicetype(self):
         """Return device type."""
         return self._devicetype
@@ -150,9 +364,13 @@ class RestObject:
     """RestObject.
 
     A REST object that contains a REST item and communicates with the REST.
-    It contains a REST Client for setting and getting REST register values
+    It contains a REST Client for setting and getting REST register values.
+    One RestObject is created per item when the coordinator is set up and is
+    reused for all reads and writes of that item.
     """
 
+    __slots__ = ("_rest_item", "_rest_api", "_codec", "_divider")
+
     def __init__(self, rest_api: RestAPI, rest_item: RestItem) -> None:
         """Construct RestObject.
 
@@ -163,27 +381,20 @@ class RestObject:
         """
         self._rest_item = rest_item
         self._rest_api = rest_api
-        self._divider = 1
-        if self._rest_item.params is not None:
-            self._divider = self._rest_item.params.get("divider", 1)
+        self._codec = rest_item.codec
+        self._divider = self._codec.divider
 
     def order_hex_buffer(self, buffer: str, flip) -> str:
         """brings a hex buffer in the right order"""
-        if flip is True:
-            little_endian = bytes.fromhex(buffer)[::-1].hex()
-            return little_endian
-        big_endian = bytes.fromhex(buffer)[::1].hex()
-        return big_endian
+        return self._codec.order_hex_buffer(buffer, flip)
 
     def format_int_message(self, number: int, flip) -> str:
         """format int message as hex buffer to be sent to REST APPI"""
-        numbytes = str(self._rest_item.write_bytes * 2)
-        mask = "%0." + numbytes + "X"
-        return self.order_hex_buffer(mask % number, flip)
+        return self._codec.encode_int(number, flip)
 
     def format_str_message(self, text: str, flip) -> str:
         """format str message as hex buffer to be sent to REST APPI"""
-        return self.order_hex_buffer(text.encode("utf-8").hex(), flip)
+        return self._codec.encode_str(text, flip)
 
     @property
     async def value(self):
@@ -194,52 +405,23 @@ class RestObject:
             return None
 
         res = await self._rest_api.get_rest(self._rest_item.address_read)
+        return self.decode(res)
 
+    def decode(self, res: str):
+        """Decode the value of the rest item from a raw response of its address.
+
+        Several items share one address_read, so one response can be decoded
+        by all of them.
+        """
         if res is None:
             return None
+        if self._rest_item.format is FORMATS.BUTTON:
+            return None
 
         # Store the raw value in the rest_item
         self._rest_item.raw_value = res
 
-        index = self._rest_item.read_index * 2
-        big_endian = res[index : index + self._rest_item.read_bytes * 2]
-        little_endian = bytes.fromhex(big_endian)[::-1].hex()
-        big_endian = bytes.fromhex(big_endian)[::1].hex()
-
-        if big_endian is None:
-            return None
-        if little_endian is None:
-            return None
-        if big_endian == "":
-            return None
-        if little_endian == "":
-            return None
-        match self._rest_item.format:
-            case FORMATS.SWITCH:
-                return None
-            case FORMATS.NUMBER:
-                return float(int(little_endian, 16) / self._divider)
-            case FORMATS.SW_VERSION:
-                major = str(int(little_endian[0:2], 16))
-                minor = str(int(little_endian[2:4], 16)).zfill(2)
-                letter = str(bytearray.fromhex(little_endian[4:6]).decode())
-                return str(major + "." + minor + letter)
-            case FORMATS.TIMESTAMP:
-                return str(datetime.fromtimestamp(int(big_endian, 16)))
-            case FORMATS.TEXT:
-                return bytearray.fromhex(big_endian).decode()
-            case FORMATS.STATUS:
-                return self._rest_item.get_translation_key_from_number(
-                    int(little_endian, 16)
-                )
-            case _:
-                log.warning(
-                    "Unknown format: %s in %s",
-                    str(self._rest_item.type),
-                    str(self._rest_item.translation_key),
-                )
-                return None
-        return None
+        return self._codec.decode(res)
 
     # @value.setter
     async def setvalue(self, value=None) -> None:
@@ -253,7 +435,9 @@ class RestObject:
         if self._rest_item.type == TYPES.SENSOR:
             return
         if self._rest_item.format is FORMATS.BUTTON:
-            await self._rest_api.set_rest(self._rest_item.address_write, "")
+            await self._rest_api.set_rest(
+                self._rest_item.address_write, "", self._rest_item.address_read
+            )
             return
         if value is None:
             return
@@ -263,7 +447,9 @@ class RestObject:
                 if value == 0:
                     await self._rest_api.set_rest(self._rest_item.address_read, "")
                 if value == 1:
-                    await self._rest_api.set_rest(self._rest_item.address_write, "")
+                    await self._rest_api.set_rest(
+                        self._rest_item.address_write, "", self._rest_item.address_read
+                    )
                 return
             case FORMATS.NUMBER:
                 towrite = self.format_int_message(
@@ -285,7 +471,9 @@ class RestObject:
                 )
                 return
         if towrite is not None:
-            await self._rest_api.set_rest(self._rest_item.address_write, towrite)
+            await self._rest_api.set_rest(
+                self._rest_item.address_write, towrite, self._rest_item.address_read
+            )
         return
 
     async def addvalue(self, value=None) -> None:
@@ -305,24 +493,10 @@ class RestObject:
 
         res = await self._rest_api.get_rest(self._rest_item.address_read)
 
-        if res is None:
+        offset = self._codec.decode_number(res)
+        if offset is None:
             return None
 
-        index = self._rest_item.read_index * 2
-        big_endian = res[index : index + self._rest_item.read_bytes * 2]
-        little_endian = bytes.fromhex(big_endian)[::-1].hex()
-        big_endian = bytes.fromhex(big_endian)[::1].hex()
-
-        if big_endian is None:
-            return None
-        if little_endian is None:
-            return None
-        if big_endian == "":
-            return None
-        if little_endian == "":
-            return None
-        offset = float(int(little_endian, 16) / self._divider)
-
         #        self._rest_item.state = value + offset
         match self._rest_item.format:
             case FORMATS.NUMBER:
@@ -357,5 +531,7 @@ class RestObject:
                 )
                 return
         if towrite is not None:
-            await self._rest_api.set_rest(self._rest_item.address_write, towrite)
+            await self._rest_api.set_rest(
+                self._rest_item.address_write, towrite, self._rest_item.address_read
+            )
         return
@@ -10,7 +10,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .configentry import MyConfigEntry
 from .const import TYPES
 from .entity_helpers import build_entity_list
-from .jdconst import DEVICELISTS
 
 logging.basicConfig()
 log: logging.Logger = logging.getLogger(name=__name__)
@@ -29,25 +28,22 @@ async def async_setup_entry(
     # we create one communicator per integration only for better performance and to allow dynamic parameters
     coordinator = config_entry.runtime_data.coordinator
 
-    for device in DEVICELISTS:
-        entries = await build_entity_list(
-            entries=entries,
-            config_entry=config_entry,
-            rest_items=device,
-            item_type=TYPES.SELECT,
-            coordinator=coordinator,
-        )
-
-    for device in DEVICELISTS:
-        entries = await build_entity_list(
-            entries=entries,
-            config_entry=config_entry,
-            rest_items=device,
-            item_type=TYPES.SELECT_NOIF,
-            coordinator=coordinator,
-        )
-
-    async_add_entities(
-        entries,
-        update_before_add=True,
+    entries = await build_entity_list(
+        entries=entries,
+        config_entry=config_entry,
+        rest_items=coordinator.rest_items,
+        item_type=TYPES.SELECT,
+        coordinator=coordinator,
     )
+
+    entries = await build_entity_list(
+        entries=entries,
+        config_entry=config_entry,
+        rest_items=coordinator.rest_items,
+        item_type=TYPES.SELECT_NOIF,
+        coordinator=coordinator,
+    )
+
+    # no update before add, the values are read by the background refresh
+    # of the coordinator and the entities start with their restored states
+    async_add_entities(entries)
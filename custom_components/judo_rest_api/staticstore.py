@@ -0,0 +1,142 @@
+"""Static register store.
+
+Persists the raw responses of the static registers (device type, device
+number, software version, commissioning date, service contact) in the Home
+Assistant storage, so they are not read again after a restart or reload,
+and the addresses a device does not implement, see capabilities.py.
+The data is stored per device, keyed by the raw device number (0600),
+and every config entry refers to the device it was last connected to.
+"""
+
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import CONST
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{CONST.DOMAIN}.static_registers"
+# seconds to collect changes of several entries into one write
+SAVE_DELAY = 10
+
+# device number, the key of a device in the store
+SERIAL_ADDRESS = "0600"
+# read again some time after a restart, to detect a replaced device or a
+# firmware update
+REVALIDATE_ADDRESSES = (SERIAL_ADDRESS, "0100")
+# seconds after the start until these registers are read again
+REVALIDATE_DELAY = 300
+
+
+class StaticRegisterStore:
+    """StaticRegisterStore.
+
+    One store shared by all config entries of the integration.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Construct StaticRegisterStore.
+
+        :param hass: Home Assistant
+        :type hass: HomeAssistant
+        """
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> dict:
+        """Load the store once."""
+        async with self._lock:
+            if self._data is None:
+                data = await self._store.async_load()
+                if not isinstance(data, dict):
+                    data = {}
+                data.setdefault("devices", {})
+                data.setdefault("entries", {})
+                data.setdefault("unsupported", {})
+                self._data = data
+        return self._data
+
+    async def async_get_registers(self, entry_id: str) -> dict[str, str]:
+        """Return the stored registers of the device of a config entry."""
+        data = await self.async_load()
+        serial = data["entries"].get(entry_id)
+        if serial is None:
+            return {}
+        return dict(data["devices"].get(serial, {}))
+
+    def save_registers(self, entry_id: str, registers: dict[str, str]):
+        """Store the registers of the device of a config entry."""
+        if self._data is None:
+            # not loaded yet, saving now would overwrite the other devices
+            return
+        serial = registers.get(SERIAL_ADDRESS)
+        if serial is None:
+            return
+        self._data["devices"][serial] = dict(registers)
+        self._data["entries"][entry_id] = serial
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    async def async_get_unsupported(
+        self, entry_id: str, device_type: str | None
+    ) -> list[str]:
+        """Return the unsupported addresses of the device of a config entry.
+
+        Nothing is returned if the stored device has another device type.
+        """
+        data = await self.async_load()
+        serial = data["entries"].get(entry_id)
+        if serial is None:
+            return []
+        stored_type = data["devices"].get(serial, {}).get("FF00")
+        if stored_type is not None and stored_type != device_type:
+            return []
+        return list(data["unsupported"].get(serial, []))
+
+    def save_unsupported(self, entry_id: str, addresses: list[str]) -> bool:
+        """Store the unsupported addresses, False if the device is not known yet."""
+        if self._data is None:
+            return False
+        serial = self._data["entries"].get(entry_id)
+        if serial is None:
+            return False
+        self._data["unsupported"][serial] = sorted(addresses)
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+        return True
+
+    def clear_unsupported(self, entry_id: str):
+        """Forget the unsupported addresses, e.g. after a firmware update."""
+        if self._data is None:
+            return
+        serial = self._data["entries"].get(entry_id)
+        if self._data["unsupported"].pop(serial, None) is None:
+            return
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    def remove_entry(self, entry_id: str):
+        """Forget the device of a config entry, e.g. after the device changed.
+
+        The device is dropped as well if no other config entry refers to it.
+        """
+        if self._data is None:
+            return
+        serial = self._data["entries"].pop(entry_id, None)
+        if serial is None:
+            return
+        if serial not in self._data["entries"].values():
+            self._data["devices"].pop(serial, None)
+            self._data["unsupported"].pop(serial, None)
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+
+def async_get_static_store(hass: HomeAssistant) -> StaticRegisterStore:
+    """Return the static register store, create it on first use."""
+    store = hass.data.get(STORAGE_KEY)
+    if store is None:
+        store = hass.data[STORAGE_KEY] = StaticRegisterStore(hass)
+    return store
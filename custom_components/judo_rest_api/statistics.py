@@ -0,0 +1,126 @@
+"""Statistics.
+
+Reads the consumption statistics of the device. Each statistic register is
+requested with the period appended to its command and returns a buffer of
+4 byte values in liters, little endian like all other numbers of the device:
+
+FB00 + day, month, year:  8 values, one per 3 hours of the day
+FC00 + week, year:        7 values, one per day of the week
+FD00 + month, year:      31 values, one per day of the month
+FE00 + year:             12 values, one per month of the year
+
+The values of past periods do not change anymore, so they are cached and only
+the current period is requested again.
+"""
+
+import logging
+from datetime import date, timedelta
+
+from .restobject import RestAPI
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+STATISTICS_COMMANDS = ("FB00", "FC00", "FD00", "FE00")
+
+VALUE_BYTES = 4
+
+# number of cached past periods per statistic
+CACHE_SIZE = 4
+
+
+def period_key(command: str, today: date, offset: int = 0) -> tuple:
+    """Return the period of a statistic, offset periods before today."""
+    match command:
+        case "FB00":
+            day = today - timedelta(days=offset)
+            return (day.year, day.month, day.day)
+        case "FC00":
+            iso = (today - timedelta(weeks=offset)).isocalendar()
+            return (iso.year, iso.week)
+        case "FD00":
+            months = today.year * 12 + today.month - 1 - offset
+            return (months // 12, months % 12 + 1)
+        case "FE00":
+            return (today.year - offset,)
+    return None
+
+
+def period_payload(command: str, key: tuple) -> str:
+    """Return the hex payload to request the statistic of a period."""
+    year = key[0].to_bytes(2, "little").hex().upper()
+    match command:
+        case "FB00":
+            return f"{key[2]:02X}{key[1]:02X}{year}"
+        case "FC00" | "FD00":
+            return f"{key[1]:02X}{year}"
+        case "FE00":
+            return year
+    return None
+
+
+def decode_statistic(res: str) -> list[int] | None:
+    """Decode a statistic buffer into its consumption values in liters."""
+    if res is None:
+        return None
+    data = bytes.fromhex(res)
+    if len(data) < VALUE_BYTES:
+        return None
+    return [
+        int.from_bytes(data[index : index + VALUE_BYTES], "little")
+        for index in range(0, len(data) - VALUE_BYTES + 1, VALUE_BYTES)
+    ]
+
+
+class StatisticsEngine:
+    """StatisticsEngine.
+
+    Fetches and decodes the statistic registers and caches the values of
+    past periods.
+    """
+
+    def __init__(self, rest_api: RestAPI) -> None:
+        """Construct StatisticsEngine.
+
+        :param rest_api: The REST API
+        :type rest_api: RestAPI
+        """
+        self._rest_api = rest_api
+        self._cache: dict[str, dict[tuple, list[int]]] = {
+            command: {} for command in STATISTICS_COMMANDS
+        }
+        self._current: dict[str, tuple[tuple, list[int]]] = {}
+
+    async def async_get_values(
+        self, command: str, today: date, offset: int = 0
+    ) -> list[int] | None:
+        """Return the values of a statistic, offset periods before today."""
+        key = period_key(command, today, offset)
+        if key is None:
+            return None
+        past = offset > 0
+        cache = self._cache[command]
+        if past and key in cache:
+            return cache[key]
+
+        res = await self._rest_api.get_rest(command + period_payload(command, key))
+        values = decode_statistic(res)
+        if values is None:
+            log.warning("No statistic received for %s %s", command, str(key))
+            return None
+
+        if past:
+            cache[key] = values
+            while len(cache) > CACHE_SIZE:
+                del cache[next(iter(cache))]
+        else:
+            self._current[command] = (key, values)
+        return values
+
+    def get_values(self, command: str) -> dict:
+        """Return all known values of a statistic, e.g. for diagnostics."""
+        result = {str(key): values for key, values in self._cache[command].items()}
+        if command in self._current:
+            key, values = self._current[command]
+            result[str(key)] = values
+        return result
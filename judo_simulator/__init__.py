@@ -0,0 +1,12 @@
+"""Local simulator of the Judo REST API.
+
+Serves simulated devices on local ports so the integration can be run and
+measured without real hardware, e.g.:
+
+    python -m judo_simulator --port 8080 --latency 0.05 --error-rate 0.01
+"""
+
+from .device import SimulatedDevice
+from .server import Faults, SimulatorServer
+
+__all__ = ["Faults", "SimulatedDevice", "SimulatorServer"]
@@ -0,0 +1,84 @@
+"""Command line entry point of the simulator."""
+
+import argparse
+import asyncio
+import logging
+
+from .device import SimulatedDevice
+from .server import Faults, SimulatorServer
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(
+        prog="judo_simulator", description="Simulated Judo REST API"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--devices", type=int, default=1, help="devices on consecutive ports"
+    )
+    parser.add_argument("--device-type", default="33", help="answer of FF00")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="Connectivity")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--hang-time", type=float, default=60.0, help="seconds")
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace):
+    """Serve the devices until cancelled."""
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        truncate_rate=args.truncate_rate,
+        drop_rate=args.drop_rate,
+        hang_rate=args.hang_rate,
+        hang_time=args.hang_time,
+    )
+    servers = []
+    for index in range(args.devices):
+        seed = None if args.seed is None else args.seed + index
+        server = SimulatorServer(
+            SimulatedDevice(
+                device_type=args.device_type,
+                serial_number=121188 + index,
+                seed=seed,
+            ),
+            faults=faults,
+            host=args.host,
+            port=args.port + index,
+            username=args.username or None,
+            password=args.password,
+            seed=seed,
+        )
+        await server.start()
+        servers.append(server)
+        print(f"Judo device {index + 1} on {server.url}")  # noqa: T201
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for server in servers:
+            await server.stop()
+
+
+def main():
+    """Run the simulator."""
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(run(parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""Simulated Judo device.
+
+Holds the registers listed in const.COMMANDS and lets them evolve over time
+like a real water softener: water is drawn in random taps, the water
+counters and the operating counters increase and the salt storage depletes.
+All values are encoded in the layout the integration decodes.
+"""
+
+import random
+import time
+from datetime import date, timedelta
+
+# liters per kg of salt, used to deplete the salt storage
+LITERS_PER_KG_SALT = 400
+
+# registers requested with a period appended, still a read
+STATISTIC_COMMANDS = ("FB00", "FC00", "FD00", "FE00")
+
+# commands without payload that are writes
+BUTTON_COMMANDS = ("3C00", "3D00")
+
+
+def _le(value: int, size: int) -> str:
+    """Encode an int as little endian hex."""
+    return int(value).to_bytes(size, "little").hex()
+
+
+class SimulatedDevice:
+    """SimulatedDevice.
+
+    A water softener answering the read and write commands of the REST API.
+    """
+
+    def __init__(
+        self,
+        device_type: str = "33",
+        serial_number: int = 121188,
+        seed: int | None = None,
+        clock=time.monotonic,
+    ) -> None:
+        """Construct SimulatedDevice.
+
+        :param device_type: device type as answered by FF00, see DEVICETYPES
+        :param serial_number: device number answered by 0600
+        :param seed: seed of the random water taps, for reproducible runs
+        :param clock: monotonic clock in seconds
+        """
+        self._random = random.Random(seed)
+        self._clock = clock
+        self._last = clock()
+        self.device_type = device_type
+        self.serial_number = serial_number
+        self.sw_version = (2, 21, "k")
+        self.install_date = int(time.time()) - 400 * 86400
+        self.service_contact = "+49 7195 692517 "
+        self.hardness = 6
+        self.salt_warning = 14
+        self.salt_mass = 21750  # g
+        self.water_total = 1057516.0  # l
+        self.water_treated = 56366.0  # l
+        self.operating_minutes = 400 * 24 * 60
+        self.valve_closed = False
+        self.regenerations = 0
+        # current tap: liters per minute and seconds left
+        self._flow = 0.0
+        self._flow_left = 0.0
+        # consumption per day and 3 hour slot, for the statistic registers
+        self._consumption: dict[date, list[float]] = {}
+
+    def advance(self):
+        """Let the device state evolve up to now."""
+        now = self._clock()
+        elapsed = now - self._last
+        self._last = now
+        while elapsed > 0:
+            if self._flow_left <= 0:
+                # start a new tap now and then, otherwise stay idle
+                if self._random.random() < 0.3:
+                    self._flow = round(self._random.uniform(2, 12), 1)
+                    self._flow_left = self._random.uniform(10, 120)
+                else:
+                    self._flow = 0.0
+                    self._flow_left = self._random.uniform(30, 600)
+            step = min(elapsed, self._flow_left)
+            self._flow_left -= step
+            elapsed -= step
+            self._draw(0 if self.valve_closed else self._flow * step / 60)
+            self.operating_minutes += step / 60
+
+    def _draw(self, liters: float):
+        """Account drawn water in the counters, the salt and the statistics."""
+        if liters <= 0:
+            return
+        self.water_total += liters
+        self.water_treated += liters * 0.8
+        self.salt_mass = max(0, self.salt_mass - liters * 1000 / LITERS_PER_KG_SALT)
+        today = date.today()
+        slots = self._consumption.setdefault(today, [0.0] * 8)
+        slots[time.localtime().tm_hour // 3] += liters
+
+    @property
+    def salt_days(self) -> int:
+        """Return the estimated days until the salt is used up."""
+        return int(self.salt_mass / 1000 * 7)
+
+    @staticmethod
+    def is_write(command: str) -> bool:
+        """Return True if the command is a write, False if it is a read."""
+        if command in BUTTON_COMMANDS:
+            return True
+        return len(command) > 4 and command[:4] not in STATISTIC_COMMANDS
+
+    def read(self, command: str) -> str | None:
+        """Return the hex data of a read command, None if unknown."""
+        self.advance()
+        minutes = int(self.operating_minutes)
+        match command[:4]:
+            case "FF00":
+                return self.device_type
+            case "0600":
+                return _le(self.serial_number, 4)
+            case "0100":
+                major, minor, letter = self.sw_version
+                return letter.encode().hex() + _le(minor, 1) + _le(major, 1)
+            case "0E00":
+                return int(self.install_date).to_bytes(4, "big").hex()
+            case "2500":
+                return (
+                    _le(minutes % 60, 1)
+                    + _le(minutes // 60 % 24, 1)
+                    + _le(minutes // 1440, 2)
+                )
+            case "5800":
+                return self.service_contact.encode().hex()
+            case "5100":
+                return _le(self.hardness, 2)
+            case "5600":
+                return _le(self.salt_mass, 2) + _le(self.salt_days, 2)
+            case "5700":
+                return _le(self.salt_warning, 1)
+            case "2800":
+                return _le(self.water_total, 4)
+            case "2900":
+                return _le(self.water_treated, 4)
+            case "FB00" | "FC00" | "FD00" | "FE00":
+                return self._statistic(command[:4], command[4:])
+        return None
+
+    def write(self, command: str) -> bool:
+        """Execute a write command, return False if unknown."""
+        self.advance()
+        payload = command[4:]
+        match command[:4]:
+            case "3000":
+                self.hardness = int.from_bytes(bytes.fromhex(payload), "little")
+            case "5600":
+                self.salt_mass = int.from_bytes(bytes.fromhex(payload), "little")
+            case "5700":
+                self.salt_warning = int.from_bytes(bytes.fromhex(payload), "little")
+            case "3C00":
+                self.valve_closed = True
+            case "3D00":
+                self.valve_closed = False
+            case "3500":
+                self.regenerations += 1
+            case _:
+                return False
+        return True
+
+    def _daily(self, day: date) -> float:
+        """Return the consumption of a day."""
+        slots = self._consumption.get(day)
+        if slots is None:
+            # past days before the start of the simulation
+            if day >= date.today():
+                return 0.0
+            return 150.0 + (day.toordinal() % 7) * 20
+        return sum(slots)
+
+    def _statistic(self, command: str, payload: str) -> str | None:
+        """Return the buffer of a statistic register, 4 byte liters per value."""
+        try:
+            data = bytes.fromhex(payload)
+        except ValueError:
+            return None
+        year = int.from_bytes(data[-2:], "little") if len(data) >= 2 else 0
+        try:
+            match command:
+                case "FB00":
+                    day = date(year, data[1], data[0])
+                    slots = self._consumption.get(day)
+                    if slots is None:
+                        slots = [self._daily(day) / 8] * 8
+                    values = slots
+                case "FC00":
+                    monday = date.fromisocalendar(year, data[0], 1)
+                    values = [self._daily(monday + timedelta(days=i)) for i in range(7)]
+                case "FD00":
+                    first = date(year, data[0], 1)
+                    values = [
+                        self._daily(first + timedelta(days=i))
+                        if (first + timedelta(days=i)).month == first.month
+                        else 0.0
+                        for i in range(31)
+                    ]
+                case "FE00":
+                    values = [
+                        sum(
+                            self._daily(date(year, month, 1) + timedelta(days=i))
+                            for i in range(28)
+                        )
+                        for month in range(1, 13)
+                    ]
+                case _:
+                    return None
+        except (ValueError, IndexError):
+            return None
+        return "".join(_le(value, 4) for value in values)
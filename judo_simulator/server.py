@@ -0,0 +1,161 @@
+"""Simulated REST API.
+
+Serves a SimulatedDevice at /api/rest/<hex command> with the response shape
+of the real device, {"data": "<hex>"}, and injects faults on request:
+latency with jitter, error status codes, truncated hex data, dropped
+connections and requests that never get an answer.
+"""
+
+import asyncio
+import base64
+import logging
+import random
+from collections import Counter
+from dataclasses import dataclass
+
+from aiohttp import web
+
+from .device import SimulatedDevice
+
+logging.basicConfig()
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Faults:
+    """Fault injection settings, all rates are probabilities per request."""
+
+    latency: float = 0.0  # s
+    jitter: float = 0.0  # s
+    error_rate: float = 0.0
+    error_status: int = 500
+    truncate_rate: float = 0.0
+    drop_rate: float = 0.0
+    hang_rate: float = 0.0
+    hang_time: float = 60.0  # s
+
+
+class SimulatorServer:
+    """SimulatorServer.
+
+    One simulated device behind its own port.
+    """
+
+    def __init__(
+        self,
+        device: SimulatedDevice,
+        faults: Faults | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        username: str | None = None,
+        password: str | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Construct SimulatorServer.
+
+        :param device: the simulated device answering the commands
+        :param faults: fault injection settings, none if omitted
+        :param host: address to listen on
+        :param port: port to listen on, 0 picks a free port
+        :param username: user of the basic auth, no auth if omitted
+        :param password: password of the basic auth
+        :param seed: seed of the fault injection, for reproducible runs
+        """
+        self.device = device
+        self.faults = faults or Faults()
+        self._host = host
+        self._port = port
+        self._auth = None
+        if username is not None:
+            token = base64.b64encode(f"{username}:{password or ''}".encode())
+            self._auth = "Basic " + token.decode()
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.stats = {"requests": 0, "bytes": 0, "errors": 0, "dropped": 0}
+        self.addresses: Counter[str] = Counter()
+
+    @property
+    def port(self) -> int:
+        """Return the port the server listens on."""
+        return self._port
+
+    @property
+    def url(self) -> str:
+        """Return the base url of the server."""
+        return f"http://{self._host}:{self._port}"
+
+    def reset_stats(self):
+        """Reset the request statistics, e.g. between benchmark runs."""
+        self.stats = dict.fromkeys(self.stats, 0)
+        self.addresses.clear()
+
+    async def start(self):
+        """Start listening."""
+        app = web.Application()
+        app.router.add_get("/api/rest/{command}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        # resolve the port picked by the OS
+        self._port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        log.info("Simulator listening on %s", self.url)
+
+    async def stop(self):
+        """Stop listening."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _hit(self, rate: float) -> bool:
+        """Return True with the probability rate."""
+        return rate > 0 and self._random.random() < rate
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer a command like the device, with the configured faults."""
+        command = request.match_info["command"].upper()
+        self.stats["requests"] += 1
+        self.addresses[command[:4]] += 1
+
+        authorization = request.headers.get("Authorization")
+        if self._auth is not None and authorization != self._auth:
+            self.stats["errors"] += 1
+            return web.Response(status=401)
+
+        faults = self.faults
+        delay = faults.latency
+        if faults.jitter > 0:
+            delay += self._random.uniform(0, faults.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self._hit(faults.hang_rate):
+            await asyncio.sleep(faults.hang_time)
+        if self._hit(faults.drop_rate):
+            self.stats["dropped"] += 1
+            if request.transport is not None:
+                request.transport.close()
+            raise web.HTTPServiceUnavailable
+        if self._hit(faults.error_rate):
+            self.stats["errors"] += 1
+            return web.Response(status=faults.error_status)
+
+        if self.device.is_write(command):
+            if not self.device.write(command):
+                self.stats["errors"] += 1
+                return web.Response(status=404)
+            return self._respond({"data": ""})
+
+        data = self.device.read(command)
+        if data is None:
+            self.stats["errors"] += 1
+            return web.Response(status=404)
+        if self._hit(faults.truncate_rate):
+            data = data[: self._random.randrange(len(data) + 1)]
+        return self._respond({"data": data.upper()})
+
+    def _respond(self, payload: dict) -> web.Response:
+        """Build the json response and count its size."""
+        response = web.json_response(payload)
+        self.stats["bytes"] += len(response.body)
+        return response